@@ -50,6 +50,7 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
             "black>=22.0.0",
             "flake8>=5.0.0",
             "mypy>=0.991",
@@ -59,6 +60,10 @@ setup(
             "sphinx-rtd-theme>=1.0.0",
             "myst-parser>=0.18.0",
         ],
+        "perf": [
+            "orjson>=3.8.0",
+            "numba>=0.56.0",
+        ],
     },
     
     # Python version requirement
@@ -4,11 +4,24 @@ Jinn-Core: Economic Simulation Engine
 Main simulation engine for running economic models and scenarios.
 """
 
+import copy
+import hashlib
 import json
 import logging
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional dependency; fall back to the stdlib parser
+    orjson = None
+
 try:
     # Try relative imports first (when used as a module)
     from .models.interest_rate import InterestRateModel
@@ -39,14 +52,81 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _read_scenario_bytes_cached(scenario_path: str, mtime_ns: int, size: int) -> bytes:
+    """Read a scenario file; modification time and size are part of the key so edits are re-read."""
+    with open(scenario_path, 'rb') as f:
+        return f.read()
+
+
+def _read_scenario_bytes(scenario_path: str) -> bytes:
+    """Read the raw bytes of a scenario file, reusing them while the file is unchanged."""
+    try:
+        stat = os.stat(scenario_path)
+    except OSError:
+        # Read uncached and let open() report a missing or unreadable file
+        with open(scenario_path, 'rb') as f:
+            return f.read()
+    return _read_scenario_bytes_cached(os.path.abspath(scenario_path), stat.st_mtime_ns, stat.st_size)
+
+
+# Numbers this long may be integers wider than 64 bits, which orjson rounds to floats
+_LONG_NUMBER = re.compile(rb'\d{19}')
+
+
+def _parse_scenario(data: bytes) -> Any:
+    """Parse scenario JSON with orjson where it reads the data exactly as json.loads does."""
+    if orjson is not None and _LONG_NUMBER.search(data) is None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # json.loads also accepts NaN and Infinity
+            pass
+    return json.loads(data)
+
+
+def _scenario_key(scenario: Dict[str, Any]) -> Optional[bytes]:
+    """Digest of a scenario's canonical JSON, or None if it is not JSON-serializable."""
+    try:
+        canonical = json.dumps(scenario, sort_keys=True, separators=(',', ':'))
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(canonical.encode()).digest()
+
+
+# Engine of a run_simulation_parallel worker process, built on its first scenario
+_worker_engine = None
+
+
+def _init_worker():
+    """Keep numba kernels single-threaded in pool workers; the pool already uses every core."""
+    try:
+        import numba
+    except ImportError:  # Optional dependency
+        return
+    numba.set_num_threads(1)
+
+
+def _run_in_worker(scenario: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one scenario in a pool worker, reusing the worker's engine."""
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = SimulationEngine()
+    return _worker_engine.run_simulation(scenario)
+
+
 class SimulationEngine:
     """Main simulation engine for economic modeling."""
     
+    # Maximum number of results kept for run_simulation(..., use_cache=True)
+    RESULT_CACHE_SIZE = 128
+    
     def __init__(self):
         """Initialize the simulation engine."""
         self.models = {}
         self.scenarios = {}
         self.results = {}
+        self._result_cache: Dict[bytes, Dict[str, Any]] = {}
         self._register_models()
     
     def _register_models(self):
@@ -75,40 +155,61 @@ class SimulationEngine:
             Dict containing scenario configuration
         """
         try:
-            with open(scenario_path, 'r') as f:
-                scenario = json.load(f)
+            # Only the raw bytes are cached; parsing them again gives every
+            # caller its own dict and costs less than deep-copying a cached one.
+            # Both parsers take bytes directly, with no text decoding layer
+            scenario = _parse_scenario(_read_scenario_bytes(scenario_path))
             logger.info(f"Loaded scenario from {scenario_path}")
             return scenario
         except Exception as e:
             logger.error(f"Failed to load scenario from {scenario_path}: {e}")
             raise
     
-    def run_simulation(self, scenario: Dict[str, Any]) -> Dict[str, Any]:
+    def run_simulation(self, scenario: Dict[str, Any], use_cache: bool = False) -> Dict[str, Any]:
         """
         Run a simulation based on the provided scenario.
         
         Args:
             scenario: Dictionary containing scenario configuration
+            use_cache: Reuse the results of an earlier cached run of an
+                identical scenario. Only for deterministic models; off by
+                default because some models (e.g. bank_panic) draw unseeded
+                random numbers and should differ between runs.
             
         Returns:
-            Dictionary containing simulation results
+            Dictionary containing simulation results. Cached results are
+            copies, marked with ``metadata['cached']`` and keeping the
+            timings of the run that produced them.
         """
+        # One lookup in the registry both dispatches and validates the name
         model_name = scenario.get('model')
-        if model_name not in self.models:
+        model_class = self.models.get(model_name)
+        if model_class is None:
             raise ValueError(f"Unknown model: {model_name}")
         
+        if use_cache:
+            key = _scenario_key(scenario)
+            cached = self._result_cache.get(key) if key is not None else None
+            if cached is not None:
+                logger.info(f"Reusing cached {model_name} simulation results")
+                simulation_results = copy.deepcopy(cached)
+                simulation_results['metadata']['cached'] = True
+                return simulation_results
+        
         # Initialize the model
-        model_class = self.models[model_name]
         model = model_class(scenario.get('parameters', {}))
         
         # Run the simulation
         logger.info(f"Running simulation with {model_name} model")
+        # Wall-clock times are reported as-is; the duration comes from the
+        # monotonic perf_counter, which clock adjustments cannot send backwards
         start_time = datetime.now()
+        start_counter = time.perf_counter()
         
         results = model.simulate(scenario.get('simulation', {}))
         
+        execution_time = time.perf_counter() - start_counter
         end_time = datetime.now()
-        execution_time = (end_time - start_time).total_seconds()
         
         # Package results
         simulation_results = {
@@ -123,8 +224,120 @@ class SimulationEngine:
         }
         
         logger.info(f"Simulation completed in {execution_time:.2f} seconds")
+        
+        if use_cache:
+            # The model fills its defaults into the scenario's parameters, so
+            # store under the scenario both as passed and as it is now
+            self._cache_results({key, _scenario_key(scenario)} - {None}, simulation_results)
         return simulation_results
     
+    def _cache_results(self, keys: set, simulation_results: Dict[str, Any]):
+        """Store a copy of simulation results, evicting the oldest entries when full."""
+        cached = copy.deepcopy(simulation_results)
+        for key in keys:
+            self._result_cache.pop(key, None)
+            while len(self._result_cache) >= self.RESULT_CACHE_SIZE:
+                del self._result_cache[next(iter(self._result_cache))]
+            self._result_cache[key] = cached
+    
+    def run_batch(self, scenarios: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run several scenarios, batching those whose model supports it.
+        
+        Scenarios for a model class with a ``simulate_batch`` method run in a
+        single call to it; the rest run one by one as in ``run_simulation``.
+        
+        Args:
+            scenarios: List of scenario configurations
+            
+        Returns:
+            List of simulation results, in the order of ``scenarios``
+        """
+        for scenario in scenarios:
+            if scenario.get('model') not in self.models:
+                raise ValueError(f"Unknown model: {scenario.get('model')}")
+        
+        # Group scenario indices by model, keeping first-seen order
+        groups: Dict[str, List[int]] = {}
+        for index, scenario in enumerate(scenarios):
+            groups.setdefault(scenario['model'], []).append(index)
+        
+        batch_results: List[Optional[Dict[str, Any]]] = [None] * len(scenarios)
+        for model_name, indices in groups.items():
+            simulate_batch = getattr(self.models[model_name], 'simulate_batch', None)
+            if simulate_batch is None:
+                for index in indices:
+                    batch_results[index] = self.run_simulation(scenarios[index])
+                continue
+            
+            logger.info(f"Running batch of {len(indices)} simulations with {model_name} model")
+            start_time = datetime.now()
+            start_counter = time.perf_counter()
+            
+            results = simulate_batch(
+                [scenarios[index].get('parameters', {}) for index in indices],
+                [scenarios[index].get('simulation', {}) for index in indices]
+            )
+            
+            execution_time = time.perf_counter() - start_counter
+            end_time = datetime.now()
+            
+            # Package results; the timing covers the whole batch
+            for index, result in zip(indices, results):
+                batch_results[index] = {
+                    'model': model_name,
+                    'scenario': scenarios[index],
+                    'results': result,
+                    'metadata': {
+                        'start_time': start_time.isoformat(),
+                        'end_time': end_time.isoformat(),
+                        'execution_time_seconds': execution_time,
+                        'batch_size': len(indices)
+                    }
+                }
+            
+            logger.info(f"Batch completed in {execution_time:.2f} seconds")
+        
+        return batch_results
+    
+    def run_simulation_parallel(self, scenarios: List[Dict[str, Any]],
+                                max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Run several scenarios in a pool of worker processes.
+        
+        Each worker builds its own engine and runs its share of the scenarios
+        as ``run_simulation`` would. Starting the workers takes about a second,
+        so this pays off for sweeps whose scenarios take longer than that in
+        total. Workers are spawned rather than forked, so a script calling this
+        needs the usual ``if __name__ == '__main__':`` guard.
+        
+        Unlike ``run_simulation``, defaults filled in by the models do not
+        reach the caller's scenario dicts; each result's ``scenario`` is the
+        worker's filled-in copy.
+        
+        Args:
+            scenarios: List of scenario configurations
+            max_workers: Number of worker processes (default: one per CPU)
+            
+        Returns:
+            List of simulation results, in the order of ``scenarios``
+        """
+        for scenario in scenarios:
+            if scenario.get('model') not in self.models:
+                raise ValueError(f"Unknown model: {scenario.get('model')}")
+        if not scenarios:
+            return []
+        
+        workers = max_workers or os.cpu_count() or 1
+        # A few chunks per worker keeps inter-process traffic low for sweeps
+        # of many quick scenarios while still balancing the load
+        chunksize = max(1, len(scenarios) // (workers * 4))
+        
+        logger.info(f"Running {len(scenarios)} simulations on {workers} worker processes")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_worker) as executor:
+            return list(executor.map(_run_in_worker, scenarios, chunksize=chunksize))
+    
     def run_scenario_file(self, scenario_path: str) -> Dict[str, Any]:
         """
         Load and run a scenario from a file.
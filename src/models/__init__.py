@@ -9,12 +9,18 @@ from .inflation_shock import InflationShockModel, InflationShock, simulate_infla
 from .bank_panic import BankPanicModel, BankPanicShock, simulate_bank_panic
 from .military_spending_shock import MilitarySpendingShockModel, MilitarySpendingShock, simulate_military_spending_shock
 from .global_conflict import GlobalConflictModel, GlobalConflictShock, simulate_global_conflict
-from .earth_rotation_shock import EarthRotationShockModel, EarthRotationShock, simulate_earth_rotation_shock
+from .earth_rotation_shock import (
+    EarthRotationShockModel,
+    EarthRotationShock,
+    simulate_earth_rotation_shock,
+    simulate_earth_rotation_shock_batch
+)
 from .btc_price_projection import BTCPriceProjectionModel, BTCProjectionScenario, simulate_btc_price_projection
 from .cosmic_consciousness_timing import (
     CosmicConsciousnessTimingModel, 
     CosmicTimingScenario, 
     simulate_cosmic_consciousness_timing,
+    simulate_cosmic_consciousness_timing_batch,
     KARDASHEV_SCALE,
     estimate_kardashev_progress,
     get_kardashev_expansion_multiplier,
@@ -51,12 +57,14 @@ __all__ = [
     'EarthRotationShockModel',
     'EarthRotationShock',
     'simulate_earth_rotation_shock',
+    'simulate_earth_rotation_shock_batch',
     'BTCPriceProjectionModel',
     'BTCProjectionScenario',
     'simulate_btc_price_projection',
     'CosmicConsciousnessTimingModel',
     'CosmicTimingScenario',
     'simulate_cosmic_consciousness_timing',
+    'simulate_cosmic_consciousness_timing_batch',
     'KARDASHEV_SCALE',
     'estimate_kardashev_progress',
     'get_kardashev_expansion_multiplier',
@@ -0,0 +1,110 @@
+"""
+Shock Paths
+
+Helpers shared by the interest rate and inflation shock models. Single runs
+and batches build their decaying shock paths from the same ``shock_window``,
+so ``simulate_batch`` cannot drift from ``simulate``.
+"""
+
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    # Relative import when models is used as part of the src package
+    from ..utils.math_utils import persistence_powers
+except ImportError:
+    # Absolute import when src/ itself is on sys.path (tests, demos)
+    from utils.math_utils import persistence_powers
+
+
+def shock_window(magnitude: float, persistence: float, start_period: int, duration: int,
+                 periods: int) -> Optional[Tuple[slice, np.ndarray]]:
+    """
+    Locate a decaying shock within the simulated periods.
+    
+    Args:
+        magnitude: Shock size in its first period
+        persistence: Factor the shock decays by each period
+        start_period: Period the shock begins (may be negative)
+        duration: Number of periods the shock lasts
+        periods: Number of simulated periods
+    
+    Returns:
+        The affected periods and the shock in each of them, or None if the
+        shock falls entirely outside the simulation
+    """
+    first = max(start_period, 0)
+    last = min(start_period + duration, periods)
+    if first >= last:
+        return None
+    
+    powers = persistence_powers(persistence, last - start_period)
+    return slice(first, last), magnitude * powers[first - start_period:]
+
+
+def stacked_shock_paths(shocks: Sequence[Tuple[float, float, int, int]],
+                        periods: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Shock paths for several scenarios, one row per scenario.
+    
+    Args:
+        shocks: (magnitude, persistence, start_period, duration) per scenario
+        periods: Number of columns (the longest scenario)
+    
+    Returns:
+        The shock in every period (zero outside each shock window) and a
+        mask of the periods each shock is active in
+    """
+    shock = np.zeros((len(shocks), periods))
+    active = np.zeros((len(shocks), periods), dtype=bool)
+    for row, (magnitude, persistence, start_period, duration) in enumerate(shocks):
+        window = shock_window(magnitude, persistence, start_period, duration, periods)
+        if window is not None:
+            period, values = window
+            shock[row, period] = values
+            active[row, period] = True
+    return shock, active
+
+
+def stack_parameters(parameters: Sequence[Dict[str, Any]], keys: Sequence[str]) -> Dict[str, np.ndarray]:
+    """Stack each parameter into a float64 column vector with one row per scenario."""
+    return {
+        key: np.array([params[key] for params in parameters], dtype=np.float64)[:, None]
+        for key in keys
+    }
+
+
+def batch_results(lengths: Sequence[int], series: Dict[str, np.ndarray],
+                  summarize: Callable[[Dict[str, np.ndarray], np.ndarray], Dict[str, np.ndarray]]
+                  ) -> List[Dict[str, Any]]:
+    """
+    Split stacked time series into per-scenario results with summaries.
+    
+    Args:
+        lengths: Number of periods of each scenario
+        series: Time series stacked one row per scenario, padded to the
+            longest scenario
+        summarize: Reduces equally long rows of ``series`` to summary
+            statistics; called with the trimmed series and their row indices
+    
+    Returns:
+        List of result dictionaries, in the form the models' ``simulate`` returns
+    """
+    # Summaries are reduced for all scenarios of the same length at once
+    summaries: List[Optional[Dict[str, float]]] = [None] * len(lengths)
+    by_length: Dict[int, List[int]] = {}
+    for index, length in enumerate(lengths):
+        by_length.setdefault(length, []).append(index)
+    for length, indices in by_length.items():
+        rows = np.array(indices)
+        statistics = summarize({key: values[rows, :length] for key, values in series.items()}, rows)
+        for row, index in enumerate(indices):
+            summaries[index] = {key: float(value[row]) for key, value in statistics.items()}
+    
+    results = []
+    for index, length in enumerate(lengths):
+        result = {'periods': list(range(length))}
+        result.update((key, values[index, :length].tolist()) for key, values in series.items())
+        result['summary'] = summaries[index]
+        results.append(result)
+    return results
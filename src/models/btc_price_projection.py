@@ -8,13 +8,15 @@ adoption scenarios, regulatory environments, and market conditions.
 import numpy as np
 import logging
 import math
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class BTCProjectionScenario:
     """Configuration for a Bitcoin price projection scenario."""
     name: str                    # Scenario name (e.g., "baseline", "institutional_adoption")
@@ -46,6 +48,19 @@ def simulate_btc_price_projection(current_price_usd: float, target_price_usd: fl
         - price_trajectory: Year-by-year price progression
         - feasibility_assessment: Whether target is achievable
     """
+    return _project_btc_price(current_price_usd, target_price_usd, annual_growth_rate, max_years)
+
+
+def _project_btc_price(current_price_usd: float, target_price_usd: float, annual_growth_rate: float,
+                       max_years: int, log_growth_multiplier: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Project Bitcoin price growth as simulate_btc_price_projection does.
+    
+    Args:
+        log_growth_multiplier: log(target_price_usd / current_price_usd) if the
+            caller already has it, e.g. when projecting the same prices under
+            several growth rates
+    """
     # Calculate years to target using compound growth formula
     # target = current * (1 + growth_rate)^years
     # years = log(target/current) / log(1 + growth_rate)
@@ -57,27 +72,30 @@ def simulate_btc_price_projection(current_price_usd: float, target_price_usd: fl
         raise ValueError("Target price must be higher than current price")
     
     # Calculate years to target
-    growth_multiplier = target_price_usd / current_price_usd
-    years_to_target = math.log(growth_multiplier) / math.log(1 + annual_growth_rate)
+    if log_growth_multiplier is None:
+        log_growth_multiplier = math.log(target_price_usd / current_price_usd)
+    years_to_target = log_growth_multiplier / math.log1p(annual_growth_rate)
+    
+    # Price path; element t is current * (1 + growth_rate)^t
+    years = np.arange(max_years + 1)
+    prices = current_price_usd * np.power(1 + annual_growth_rate, years, dtype=np.float64)
+    return_multiples = prices / current_price_usd
     
     # Calculate final price after max_years
-    final_price = current_price_usd * ((1 + annual_growth_rate) ** max_years)
+    final_price = float(prices[-1])
     
     # Calculate total return multiple
     total_return_multiple = final_price / current_price_usd
     
-    # Calculate annual return needed to reach target in max_years
-    annual_return_needed = (target_price_usd / current_price_usd) ** (1 / max_years) - 1
+    # Calculate annual return needed to reach target in max_years;
+    # expm1 keeps precision when the required rate is small
+    annual_return_needed = math.expm1(log_growth_multiplier / max_years)
     
     # Generate price trajectory
-    price_trajectory = []
-    for year in range(max_years + 1):
-        price = current_price_usd * ((1 + annual_growth_rate) ** year)
-        price_trajectory.append({
-            'year': year,
-            'price': price,
-            'return_multiple': price / current_price_usd
-        })
+    price_trajectory = [
+        {'year': year, 'price': price, 'return_multiple': multiple}
+        for year, price, multiple in zip(years.tolist(), prices.tolist(), return_multiples.tolist())
+    ]
     
     # Feasibility assessment
     feasibility = "Achievable" if years_to_target <= max_years else "Requires longer timeframe"
@@ -101,6 +119,62 @@ def simulate_btc_price_projection(current_price_usd: float, target_price_usd: fl
     }
 
 
+@lru_cache(maxsize=1)
+def _default_scenarios() -> Mapping[str, BTCProjectionScenario]:
+    """
+    Built-in projection scenarios, constructed once per process.
+    
+    The scenario objects are frozen, so every model instance can share them.
+    """
+    return MappingProxyType({
+        'baseline': BTCProjectionScenario(
+            name="baseline",
+            annual_growth_rate=0.40,  # 40% annual growth
+            description="Steady adoption with moderate institutional interest",
+            volatility_factor=1.0,
+            adoption_curve="linear",
+            regulatory_impact=1.0,
+            institutional_factor=1.0
+        ),
+        'institutional_adoption': BTCProjectionScenario(
+            name="institutional_adoption",
+            annual_growth_rate=0.55,  # 55% annual growth
+            description="Accelerated institutional adoption and ETF approvals",
+            volatility_factor=0.8,  # Lower volatility with institutions
+            adoption_curve="exponential",
+            regulatory_impact=1.1,
+            institutional_factor=2.0
+        ),
+        'fiat_crisis': BTCProjectionScenario(
+            name="fiat_crisis",
+            annual_growth_rate=0.65,  # 65% annual growth
+            description="Fiat currency crisis drives flight to Bitcoin",
+            volatility_factor=1.5,  # Higher volatility during crisis
+            adoption_curve="exponential",
+            regulatory_impact=0.9,  # Some regulatory pushback
+            institutional_factor=1.5
+        ),
+        'regulatory_clarity': BTCProjectionScenario(
+            name="regulatory_clarity",
+            annual_growth_rate=0.50,  # 50% annual growth
+            description="Clear regulatory framework enables mainstream adoption",
+            volatility_factor=0.7,  # Lower volatility with clarity
+            adoption_curve="s_curve",
+            regulatory_impact=1.3,
+            institutional_factor=1.4
+        ),
+        'combined_shock': BTCProjectionScenario(
+            name="combined_shock",
+            annual_growth_rate=0.75,  # 75% annual growth
+            description="Perfect storm: institutional adoption + fiat crisis + regulatory clarity",
+            volatility_factor=1.2,  # Moderate volatility
+            adoption_curve="exponential",
+            regulatory_impact=1.2,
+            institutional_factor=2.5
+        )
+    })
+
+
 class BTCPriceProjectionModel:
     """
     Bitcoin Price Projection Model
@@ -176,55 +250,9 @@ class BTCPriceProjectionModel:
     
     def _define_scenarios(self) -> Dict[str, BTCProjectionScenario]:
         """Define the different Bitcoin price projection scenarios."""
-        scenarios = {
-            'baseline': BTCProjectionScenario(
-                name="baseline",
-                annual_growth_rate=0.40,  # 40% annual growth
-                description="Steady adoption with moderate institutional interest",
-                volatility_factor=1.0,
-                adoption_curve="linear",
-                regulatory_impact=1.0,
-                institutional_factor=1.0
-            ),
-            'institutional_adoption': BTCProjectionScenario(
-                name="institutional_adoption",
-                annual_growth_rate=0.55,  # 55% annual growth
-                description="Accelerated institutional adoption and ETF approvals",
-                volatility_factor=0.8,  # Lower volatility with institutions
-                adoption_curve="exponential",
-                regulatory_impact=1.1,
-                institutional_factor=2.0
-            ),
-            'fiat_crisis': BTCProjectionScenario(
-                name="fiat_crisis",
-                annual_growth_rate=0.65,  # 65% annual growth
-                description="Fiat currency crisis drives flight to Bitcoin",
-                volatility_factor=1.5,  # Higher volatility during crisis
-                adoption_curve="exponential",
-                regulatory_impact=0.9,  # Some regulatory pushback
-                institutional_factor=1.5
-            ),
-            'regulatory_clarity': BTCProjectionScenario(
-                name="regulatory_clarity",
-                annual_growth_rate=0.50,  # 50% annual growth
-                description="Clear regulatory framework enables mainstream adoption",
-                volatility_factor=0.7,  # Lower volatility with clarity
-                adoption_curve="s_curve",
-                regulatory_impact=1.3,
-                institutional_factor=1.4
-            ),
-            'combined_shock': BTCProjectionScenario(
-                name="combined_shock",
-                annual_growth_rate=0.75,  # 75% annual growth
-                description="Perfect storm: institutional adoption + fiat crisis + regulatory clarity",
-                volatility_factor=1.2,  # Moderate volatility
-                adoption_curve="exponential",
-                regulatory_impact=1.2,
-                institutional_factor=2.5
-            )
-        }
-        
-        return scenarios
+        # Each model gets its own dict to add or replace scenarios in; the
+        # frozen scenario objects themselves are shared
+        return dict(_default_scenarios())
     
     def simulate(self, simulation_config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -256,6 +284,9 @@ class BTCPriceProjectionModel:
             'summary': {}
         }
         
+        # The price ratio is shared by every scenario; only the growth rate varies
+        log_ratio = math.log(target_price / current_price) if target_price > current_price > 0 else None
+        
         # Run each scenario
         for scenario_name in scenarios_to_run:
             if scenario_name not in self.scenarios:
@@ -263,7 +294,8 @@ class BTCPriceProjectionModel:
                 continue
             
             scenario = self.scenarios[scenario_name]
-            scenario_results = self._simulate_scenario(scenario, current_price, target_price, max_years)
+            scenario_results = self._simulate_scenario(scenario, current_price, target_price, max_years,
+                                                       log_ratio)
             results['scenarios'][scenario_name] = scenario_results
         
         # Generate comparison and summary
@@ -274,72 +306,70 @@ class BTCPriceProjectionModel:
         return results
     
     def _simulate_scenario(self, scenario: BTCProjectionScenario, current_price: float,
-                          target_price: float, max_years: int) -> Dict[str, Any]:
+                          target_price: float, max_years: int,
+                          log_ratio: Optional[float] = None) -> Dict[str, Any]:
         """Simulate a single scenario with enhanced modeling."""
         
         # Base projection using simple function
-        base_result = simulate_btc_price_projection(
-            current_price, target_price, scenario.annual_growth_rate, max_years
+        base_result = _project_btc_price(
+            current_price, target_price, scenario.annual_growth_rate, max_years, log_ratio
         )
         
-        # Enhanced modeling with scenario-specific factors
-        enhanced_trajectory = []
-        volatility_trajectory = []
-        adoption_trajectory = []
+        # Enhanced modeling with scenario-specific factors, one array per
+        # series; the per-year dicts are assembled once at the end
+        years = np.arange(max_years + 1)
+        progress = years / max_years
         
-        for year in range(max_years + 1):
-            # Base price from compound growth
-            base_price = current_price * ((1 + scenario.annual_growth_rate) ** year)
-            
-            # Apply scenario-specific modifications
-            
-            # Adoption curve effects
-            adoption_factor = self._calculate_adoption_factor(year, max_years, scenario.adoption_curve)
-            
-            # Institutional impact (grows over time)
-            institutional_impact = 1 + (scenario.institutional_factor - 1) * (year / max_years)
-            
-            # Regulatory impact (stabilizes over time)
-            regulatory_impact = scenario.regulatory_impact
-            
-            # Volatility decreases over time as market matures
-            volatility = scenario.volatility_factor * self.parameters['baseline_volatility'] * (1 - year / (max_years * 2))
-            volatility = max(0.1, volatility)  # Minimum 10% volatility
-            
-            # Network effects (accelerate with adoption)
-            network_effect = adoption_factor ** self.parameters['network_effect_exponent']
-            
-            # Calculate enhanced price
-            enhanced_price = (base_price * adoption_factor * institutional_impact * 
-                            regulatory_impact * network_effect)
-            
-            enhanced_trajectory.append({
+        # Base price from compound growth
+        base_prices = current_price * np.power(1 + scenario.annual_growth_rate, years, dtype=np.float64)
+        
+        # Adoption curve effects
+        adoption_factors = self._calculate_adoption_factor(years, max_years, scenario.adoption_curve)
+        
+        # Institutional impact (grows over time)
+        institutional_impacts = 1 + (scenario.institutional_factor - 1) * progress
+        
+        # Regulatory impact (stabilizes over time)
+        regulatory_impact = scenario.regulatory_impact
+        
+        # Volatility decreases over time as market matures (minimum 10%)
+        volatilities = np.maximum(
+            0.1, scenario.volatility_factor * self.parameters['baseline_volatility'] * (1 - years / (max_years * 2))
+        )
+        
+        # Network effects (accelerate with adoption)
+        network_effects = adoption_factors ** self.parameters['network_effect_exponent']
+        
+        # Calculate enhanced price
+        enhanced_prices = (base_prices * adoption_factors * institutional_impacts *
+                           regulatory_impact * network_effects)
+        return_multiples = enhanced_prices / current_price
+        
+        adoption_trajectory = adoption_factors.tolist()
+        enhanced_trajectory = [
+            {
                 'year': year,
-                'price': enhanced_price,
+                'price': price,
                 'base_price': base_price,
                 'adoption_factor': adoption_factor,
                 'institutional_impact': institutional_impact,
                 'regulatory_impact': regulatory_impact,
                 'network_effect': network_effect,
-                'return_multiple': enhanced_price / current_price
-            })
-            
-            volatility_trajectory.append(volatility)
-            adoption_trajectory.append(adoption_factor)
+                'return_multiple': return_multiple
+            }
+            for year, price, base_price, adoption_factor, institutional_impact, network_effect, return_multiple
+            in zip(years.tolist(), enhanced_prices.tolist(), base_prices.tolist(), adoption_trajectory,
+                   institutional_impacts.tolist(), network_effects.tolist(), return_multiples.tolist())
+        ]
+        volatility_trajectory = volatilities.tolist()
         
         # Calculate enhanced metrics
         final_enhanced_price = enhanced_trajectory[-1]['price']
         enhanced_return_multiple = final_enhanced_price / current_price
         
         # Find years to target with enhanced model
-        enhanced_years_to_target = None
-        for point in enhanced_trajectory:
-            if point['price'] >= target_price:
-                enhanced_years_to_target = point['year']
-                break
-        
-        if enhanced_years_to_target is None:
-            enhanced_years_to_target = float('inf')
+        reached = np.flatnonzero(enhanced_prices >= target_price)
+        enhanced_years_to_target = int(reached[0]) if reached.size else float('inf')
         
         # Risk assessment
         risk_factors = self._assess_risk_factors(scenario, enhanced_years_to_target, max_years)
@@ -367,9 +397,9 @@ class BTCPriceProjectionModel:
             }
         }
     
-    def _calculate_adoption_factor(self, year: int, max_years: int, curve_type: str) -> float:
-        """Calculate adoption factor based on curve type."""
-        progress = year / max_years
+    def _calculate_adoption_factor(self, years: np.ndarray, max_years: int, curve_type: str) -> np.ndarray:
+        """Calculate adoption factors for an array of years based on curve type."""
+        progress = years / max_years
         
         if curve_type == "linear":
             return 1 + progress * 0.5  # Linear growth to 1.5x
@@ -381,7 +411,7 @@ class BTCPriceProjectionModel:
             sigmoid = 1 / (1 + np.exp(-x))
             return 1 + sigmoid * 0.8  # S-curve growth to 1.8x
         else:
-            return 1.0
+            return np.ones_like(progress)
     
     def _assess_risk_factors(self, scenario: BTCProjectionScenario, years_to_target: float,
                            max_years: int) -> Dict[str, Any]:
@@ -17,6 +17,13 @@ import logging
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 
+try:
+    # Relative import when models is used as part of the src package
+    from ..utils._numba_compat import NUMBA_AVAILABLE, njit
+except ImportError:
+    # Absolute import when src/ itself is on sys.path (tests, demos)
+    from utils._numba_compat import NUMBA_AVAILABLE, njit
+
 logger = logging.getLogger(__name__)
 
 # Kardashev Scale definitions
@@ -119,6 +126,56 @@ def get_kardashev_level_name(kardashev_level: float) -> str:
     return KARDASHEV_SCALE[closest_level]["name"]
 
 
+# Compiled copies of the Kardashev helpers for use inside the kernels below
+_kardashev_progress = njit(estimate_kardashev_progress)
+_kardashev_expansion_multiplier = njit(get_kardashev_expansion_multiplier)
+_kardashev_survival_bonus = njit(get_kardashev_survival_bonus)
+
+
+@njit
+def _evaluate_timing(time_left: np.ndarray, window_needed: np.ndarray,
+                     risk_tolerance: np.ndarray, starting_kardashev_level: np.ndarray,
+                     kardashev_growth_rate: np.ndarray, kardashev_enabled: bool,
+                     minimum_time_needed: np.ndarray, succeeds: np.ndarray,
+                     expansion_probability: np.ndarray, safety_margin: np.ndarray,
+                     final_kardashev_level: np.ndarray) -> None:
+    """
+    Numeric core of ``simulate_cosmic_consciousness_timing`` over arrays of inputs.
+    
+    All arrays have the same length; results are written to the last five
+    arrays element by element.
+    """
+    for i in range(time_left.shape[0]):
+        expansion_window = time_left[i]
+        start_level = starting_kardashev_level[i]
+        
+        if kardashev_enabled and expansion_window > 0:
+            final_level = _kardashev_progress(start_level, kardashev_growth_rate[i], expansion_window)
+            avg_level = (start_level + final_level) / 2
+            effective_window_needed = window_needed[i] * _kardashev_expansion_multiplier(avg_level)
+            survival_bonus = _kardashev_survival_bonus(avg_level)
+        else:
+            final_level = start_level
+            effective_window_needed = window_needed[i]
+            survival_bonus = 0.0
+        
+        minimum_needed = effective_window_needed + time_left[i] * risk_tolerance[i]
+        
+        if expansion_window <= 0:
+            base_probability = 0.0
+        elif expansion_window >= minimum_needed * 2:
+            base_probability = 0.95
+        else:
+            time_ratio = expansion_window / minimum_needed
+            base_probability = max(0.0, min(0.95, (time_ratio - 1.0) * 0.95))
+        
+        minimum_time_needed[i] = minimum_needed
+        succeeds[i] = expansion_window >= minimum_needed
+        expansion_probability[i] = min(0.99, base_probability + survival_bonus) if kardashev_enabled else base_probability
+        safety_margin[i] = max(0.0, expansion_window - effective_window_needed)
+        final_kardashev_level[i] = final_level
+
+
 def simulate_cosmic_consciousness_timing(evolution_duration: float, time_left: float,
                                        window_needed: float, risk_tolerance: float = 0.1,
                                        starting_kardashev_level: float = 0.0,
@@ -185,7 +242,7 @@ def simulate_cosmic_consciousness_timing(evolution_duration: float, time_left: f
     
     # Expansion probability based on available time vs needed time
     if expansion_window <= 0:
-        expansion_probability = 0.0
+        base_probability = 0.0
     elif expansion_window >= minimum_time_needed * 2:
         base_probability = 0.95  # High probability with plenty of time
     else:
@@ -220,6 +277,116 @@ def simulate_cosmic_consciousness_timing(evolution_duration: float, time_left: f
     }
 
 
+# Kardashev level thresholds and the values that apply from each threshold up;
+# the same tables as get_kardashev_expansion_multiplier / _survival_bonus
+_EXPANSION_MULTIPLIER_STEPS = np.array([0.5, 1.0, 1.5, 2.0, 2.5])
+_EXPANSION_MULTIPLIERS = np.array([2.0, 1.5, 1.0, 0.7, 0.3, 0.1])
+_SURVIVAL_BONUS_STEPS = np.array([0.5, 1.0, 1.5, 2.0])
+_SURVIVAL_BONUSES = np.array([0.0, 0.05, 0.15, 0.25, 0.3])
+
+# Batches at least this large use the compiled kernel; below it the one-off
+# JIT compile costs more than the NumPy expressions
+_NUMBA_MIN_SCENARIOS = 10_000
+
+
+def _evaluate_timing_vectorized(time_left: np.ndarray, window_needed: np.ndarray,
+                                risk_tolerance: np.ndarray, starting_kardashev_level: np.ndarray,
+                                kardashev_growth_rate: np.ndarray, kardashev_enabled: bool,
+                                minimum_time_needed: np.ndarray, succeeds: np.ndarray,
+                                expansion_probability: np.ndarray, safety_margin: np.ndarray,
+                                final_kardashev_level: np.ndarray) -> None:
+    """NumPy closed form of ``_evaluate_timing`` with the same signature."""
+    expansion_window = time_left
+    start_level = starting_kardashev_level
+    
+    if kardashev_enabled:
+        active = expansion_window > 0
+        effective_growth = kardashev_growth_rate * (3.0 - start_level) / 3.0
+        progressed = np.where(start_level >= 3.0, 3.0,
+                              np.minimum(start_level + effective_growth * expansion_window, 3.0))
+        final_level = np.where(active, progressed, start_level)
+        avg_level = (start_level + final_level) / 2
+        multiplier = _EXPANSION_MULTIPLIERS[np.searchsorted(_EXPANSION_MULTIPLIER_STEPS, avg_level, side='right')]
+        bonus = _SURVIVAL_BONUSES[np.searchsorted(_SURVIVAL_BONUS_STEPS, avg_level, side='right')]
+        effective_window_needed = np.where(active, window_needed * multiplier, window_needed)
+        survival_bonus = np.where(active, bonus, 0.0)
+    else:
+        final_level = start_level
+        effective_window_needed = window_needed
+    
+    minimum_needed = effective_window_needed + time_left * risk_tolerance
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ramp = np.clip((expansion_window / minimum_needed - 1.0) * 0.95, 0.0, 0.95)
+    base_probability = np.where(expansion_window <= 0, 0.0,
+                                np.where(expansion_window >= minimum_needed * 2, 0.95, ramp))
+    
+    minimum_time_needed[:] = minimum_needed
+    succeeds[:] = expansion_window >= minimum_needed
+    if kardashev_enabled:
+        expansion_probability[:] = np.minimum(0.99, base_probability + survival_bonus)
+    else:
+        expansion_probability[:] = base_probability
+    safety_margin[:] = np.maximum(0.0, expansion_window - effective_window_needed)
+    final_kardashev_level[:] = final_level
+
+
+def simulate_cosmic_consciousness_timing_batch(evolution_duration: np.ndarray, time_left: float,
+                                             window_needed: float, risk_tolerance: float = 0.1,
+                                             starting_kardashev_level: float = 0.0,
+                                             kardashev_growth_rate: float = 0.1,
+                                             kardashev_enabled: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Vectorized ``simulate_cosmic_consciousness_timing`` over many scenarios.
+    
+    Every numeric argument may be a scalar or an array; they are broadcast
+    against each other and element i of each output matches the scalar
+    function called with element i of each input.
+    
+    Args:
+        evolution_duration: Time for consciousness to evolve (billions of years)
+        time_left: Remaining time before planetary extinction (billions of years)
+        window_needed: Time required to reach another planet (billions of years)
+        risk_tolerance: Safety margin civilization requires (fraction of time_left)
+        starting_kardashev_level: Kardashev level when consciousness emerges
+        kardashev_growth_rate: Kardashev level growth per billion years
+        kardashev_enabled: Whether to apply Kardashev effects
+        
+    Returns:
+        Dict of 1-D arrays: evolution_duration, expansion_window,
+        minimum_time_needed, civilization_succeeds, expansion_probability,
+        safety_margin and final_kardashev_level
+    """
+    inputs = np.broadcast_arrays(*(
+        np.atleast_1d(np.asarray(value, dtype=np.float64)) for value in
+        (evolution_duration, time_left, window_needed, risk_tolerance,
+         starting_kardashev_level, kardashev_growth_rate)
+    ))
+    evolution_duration, time_left, window_needed, risk_tolerance, start_level, growth_rate = (
+        np.ascontiguousarray(value.ravel()) for value in inputs
+    )
+    
+    n = evolution_duration.shape[0]
+    results = {
+        'evolution_duration': evolution_duration,
+        'expansion_window': time_left,
+        'minimum_time_needed': np.empty(n),
+        'civilization_succeeds': np.empty(n, dtype=np.bool_),
+        'expansion_probability': np.empty(n),
+        'safety_margin': np.empty(n),
+        'final_kardashev_level': np.empty(n)
+    }
+    if NUMBA_AVAILABLE and n >= _NUMBA_MIN_SCENARIOS:
+        evaluate = _evaluate_timing
+    else:
+        evaluate = _evaluate_timing_vectorized
+    evaluate(time_left, window_needed, risk_tolerance, start_level, growth_rate,
+             bool(kardashev_enabled), results['minimum_time_needed'],
+             results['civilization_succeeds'], results['expansion_probability'],
+             results['safety_margin'], results['final_kardashev_level'])
+    return results
+
+
 class CosmicConsciousnessTimingModel:
     """
     Cosmic Consciousness Timing Model with Kardashev Scale Integration
@@ -388,38 +555,27 @@ class CosmicConsciousnessTimingModel:
         time_left = self.parameters['earth_extinction_time']
         variation_range = self.parameters['random_variation_range']
         
-        success_rates = []
-        expansion_probabilities = []
-        safety_margins = []
-        evolution_durations = []
-        kardashev_progressions = []
+        # Draw all random variations up front, one array per parameter
+        evolution_durations = baseline_evolution * (1 + np.random.uniform(-variation_range, variation_range, num_runs))
+        window_needed = scenario.window_needed * np.random.uniform(0.8, 1.2, num_runs)
+        risk_tolerance = scenario.risk_tolerance * np.random.uniform(0.5, 1.5, num_runs)
+        starting_kardashev = np.maximum(0.0, scenario.starting_kardashev_level + np.random.normal(0, 0.1, num_runs))
+        kardashev_growth = np.maximum(0.01, scenario.kardashev_growth_rate * np.random.uniform(0.5, 2.0, num_runs))
+        
+        batch = simulate_cosmic_consciousness_timing_batch(
+            evolution_duration=evolution_durations,
+            time_left=time_left,
+            window_needed=window_needed,
+            risk_tolerance=risk_tolerance,
+            starting_kardashev_level=starting_kardashev,
+            kardashev_growth_rate=kardashev_growth,
+            kardashev_enabled=scenario.kardashev_enabled
+        )
         
-        for _ in range(num_runs):
-            # Random variation in evolution duration
-            random_factor = np.random.uniform(-variation_range, variation_range)
-            evolution_duration = baseline_evolution * (1 + random_factor)
-            
-            # Random variation in other parameters
-            window_needed = scenario.window_needed * np.random.uniform(0.8, 1.2)
-            risk_tolerance = scenario.risk_tolerance * np.random.uniform(0.5, 1.5)
-            starting_kardashev = max(0.0, scenario.starting_kardashev_level + np.random.normal(0, 0.1))
-            kardashev_growth = max(0.01, scenario.kardashev_growth_rate * np.random.uniform(0.5, 2.0))
-            
-            result = simulate_cosmic_consciousness_timing(
-                evolution_duration=evolution_duration,
-                time_left=time_left,
-                window_needed=window_needed,
-                risk_tolerance=risk_tolerance,
-                starting_kardashev_level=starting_kardashev,
-                kardashev_growth_rate=kardashev_growth,
-                kardashev_enabled=scenario.kardashev_enabled
-            )
-            
-            success_rates.append(1 if result['civilization_succeeds'] else 0)
-            expansion_probabilities.append(result['expansion_probability'])
-            safety_margins.append(result['safety_margin'])
-            evolution_durations.append(evolution_duration)
-            kardashev_progressions.append(result['final_kardashev_level'] - result['starting_kardashev_level'])
+        success_rates = batch['civilization_succeeds'].astype(np.int64)
+        expansion_probabilities = batch['expansion_probability']
+        safety_margins = batch['safety_margin']
+        kardashev_progressions = batch['final_kardashev_level'] - starting_kardashev
         
         # Calculate statistics
         success_rate = np.mean(success_rates)
@@ -445,11 +601,11 @@ class CosmicConsciousnessTimingModel:
             'avg_kardashev_progression': avg_kardashev_progression,
             'percentiles': percentiles,
             'raw_data': {
-                'success_rates': success_rates,
-                'expansion_probabilities': expansion_probabilities,
-                'safety_margins': safety_margins,
-                'evolution_durations': evolution_durations,
-                'kardashev_progressions': kardashev_progressions
+                'success_rates': success_rates.tolist(),
+                'expansion_probabilities': expansion_probabilities.tolist(),
+                'safety_margins': safety_margins.tolist(),
+                'evolution_durations': evolution_durations.tolist(),
+                'kardashev_progressions': kardashev_progressions.tolist()
             }
         }
     
@@ -82,6 +82,18 @@ def simulate_crypto_panic(btc_price: float, eth_price: float, doge_price: float,
     }
 
 
+# Numeric parameters stacked per scenario by CryptoPanicModel.simulate_batch
+_BATCH_PARAMETER_KEYS = (
+    'btc_initial_price', 'eth_initial_price', 'doge_initial_price',
+    'btc_supply', 'eth_supply', 'doge_supply', 'num_exchanges',
+    'retail_panic_threshold', 'retail_sell_probability', 'retail_herd_multiplier',
+    'retail_doge_fomo', 'whale_coordination_prob', 'whale_doge_pump_power',
+    'exchange_recovery_rate', 'exchange_freeze_threshold', 'doge_celebrity_effect',
+    'doge_volatility_multiplier', 'doge_pump_probability', 'price_volatility_base',
+    'btc_to_eth_correlation', 'btc_to_doge_correlation', 'eth_to_doge_correlation'
+)
+
+
 class CryptoPanicModel:
     """
     Crypto Panic Model
@@ -178,317 +190,260 @@ class CryptoPanicModel:
         Returns:
             Dictionary containing simulation results
         """
-        periods = self.parameters['periods']
+        panic = self._panic_from_config(simulation_config)
+        
+        logger.info(f"Simulating crypto panic: {panic.trigger_type} with intensity {panic.trigger_intensity:.2f} "
+                   f"for {panic.panic_duration} periods starting at period {panic.start_period}")
+        
+        # A batch of one, so simulate and simulate_batch share every step
+        results = self._simulate_scenarios([self], [panic])[0]
         
-        # Set random seed for reproducibility
-        np.random.seed(self.parameters['random_seed'])
+        # Report progress; the shared loop prints and logs nothing per period
+        frozen = results['exchanges_frozen']
+        for t, panic_intensity in enumerate(results['panic_intensity'].tolist()):
+            if frozen[t] > 0 and (t == 0 or frozen[t - 1] == 0):
+                logger.info(f"Exchanges frozen due to liquidity shortage at period {t}")
+            elif frozen[t] == 0 and t > 0 and frozen[t - 1] > 0:
+                logger.info(f"Exchanges resumed operations at period {t}")
+            if t % 5 == 0 or panic_intensity > 0:
+                self._print_daily_update(t, results, panic_intensity)
         
-        # Parse panic configuration
+        logger.info("Crypto panic simulation completed")
+        return results
+    
+    @classmethod
+    def simulate_batch(cls, parameters: List[Dict[str, Any]],
+                       simulation_configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run several crypto panic simulations side by side.
+        
+        Parameters are stacked into one array per parameter with an entry per
+        scenario, and each period updates every scenario with array
+        operations. Each scenario draws from its own generator seeded with its
+        ``random_seed``, and ``simulate`` runs a batch of one, so a scenario
+        gives the same results either way. No daily updates are printed.
+        
+        Args:
+            parameters: Model calibration parameters, one dict per scenario
+            simulation_configs: Simulation configurations, one per scenario
+            
+        Returns:
+            List of result dictionaries, in the same form as ``simulate``
+        """
+        if len(parameters) != len(simulation_configs):
+            raise ValueError("parameters and simulation_configs must have the same length")
+        if not parameters:
+            return []
+        
+        models = [cls(params) for params in parameters]
+        panics = [cls._panic_from_config(config) for config in simulation_configs]
+        batch_results = cls._simulate_scenarios(models, panics)
+        
+        logger.info(f"Crypto panic batch of {len(models)} simulations completed")
+        return batch_results
+    
+    @staticmethod
+    def _panic_from_config(simulation_config: Dict[str, Any]) -> CryptoPanicShock:
+        """Build the panic described by a simulation configuration."""
         panic_config = simulation_config.get('panic', {})
-        panic = CryptoPanicShock(
+        return CryptoPanicShock(
             trigger_type=panic_config.get('trigger_type', 'whale_dump'),
             trigger_intensity=panic_config.get('trigger_intensity', 0.6),
             panic_duration=panic_config.get('panic_duration', 7),
             start_period=panic_config.get('start_period', 0),
             contagion_factor=panic_config.get('contagion_factor', 0.15)
         )
+    
+    @classmethod
+    def _simulate_scenarios(cls, models: List['CryptoPanicModel'],
+                            panics: List[CryptoPanicShock]) -> List[Dict[str, Any]]:
+        """
+        Simulate one panic per model, all scenarios advancing together.
         
-        logger.info(f"Simulating crypto panic: {panic.trigger_type} with intensity {panic.trigger_intensity:.2f} "
-                   f"for {panic.panic_duration} periods starting at period {panic.start_period}")
-        
-        # Initialize time series
-        results = {
-            'periods': list(range(periods)),
-            'btc_price': np.full(periods, self.parameters['btc_initial_price']),
-            'eth_price': np.full(periods, self.parameters['eth_initial_price']),
-            'doge_price': np.full(periods, self.parameters['doge_initial_price']),
-            'btc_volume': np.zeros(periods),
-            'eth_volume': np.zeros(periods),
-            'doge_volume': np.zeros(periods),
-            'panic_intensity': np.zeros(periods),
-            'retail_sell_rate': np.zeros(periods),
-            'whale_activity': np.zeros(periods),
-            'exchange_liquidity': np.full(periods, 1.0),  # Normalized liquidity
-            'exchanges_frozen': np.zeros(periods),
-            'doge_social_media_index': np.full(periods, 50.0),   # Neutral at 50
+        Args:
+            models: Models holding each scenario's parameters
+            panics: Panic of each scenario
+            
+        Returns:
+            List of result dictionaries, one per scenario
+        """
+        # Structure of arrays: one entry per scenario
+        p = {
+            key: np.array([model.parameters[key] for model in models], dtype=np.float64)
+            for key in _BATCH_PARAMETER_KEYS
+        }
+        start = np.array([panic.start_period for panic in panics])
+        duration = np.array([panic.panic_duration for panic in panics])
+        trigger_intensity = np.array([panic.trigger_intensity for panic in panics], dtype=np.float64)
+        rngs = [np.random.RandomState(model.parameters['random_seed']) for model in models]
+        
+        n = len(models)
+        periods = max(model.parameters['periods'] for model in models)
+        series = {
+            'btc_price': np.repeat(p['btc_initial_price'][:, None], periods, axis=1),
+            'eth_price': np.repeat(p['eth_initial_price'][:, None], periods, axis=1),
+            'doge_price': np.repeat(p['doge_initial_price'][:, None], periods, axis=1),
+            'btc_volume': np.zeros((n, periods)),
+            'eth_volume': np.zeros((n, periods)),
+            'doge_volume': np.zeros((n, periods)),
+            'panic_intensity': np.zeros((n, periods)),
+            'retail_sell_rate': np.zeros((n, periods)),
+            'whale_activity': np.zeros((n, periods)),
+            'exchange_liquidity': np.ones((n, periods)),
+            'exchanges_frozen': np.zeros((n, periods)),
+            'doge_social_media_index': np.full((n, periods), 50.0),
+            'liquidation_volume': np.zeros((n, periods)),
         }
         
-        # Initialize agent states
-        agent_states = self._initialize_agents()
+        # Agent states; every exchange of a scenario sees the same withdrawal
+        # pressure, so one reserve level and status per scenario describes them all
+        retail_panic = np.zeros(n)
+        whale_coordination = np.zeros(n)
+        whale_intent = np.zeros(n)
+        reserves = np.ones(n)
+        operational = np.ones(n, dtype=bool)
         
-        # Run simulation
         for t in range(periods):
-            # Calculate current panic intensity
-            panic_intensity = self._calculate_panic_intensity(t, panic)
-            results['panic_intensity'][t] = panic_intensity
+            # Panic intensity: ramp up to the peak, decay, then residual panic
+            relative_period = t - start
+            peak_period = duration // 2
+            # Divisors clamped at 1 for panics too short to ramp up or decay
+            ramp = trigger_intensity * (relative_period / np.maximum(peak_period, 1))
+            decay = trigger_intensity * ((duration - relative_period) / np.maximum(duration - peak_period, 1))
+            residual = trigger_intensity * 0.1 * np.exp(-0.2 * (relative_period - duration))
+            panic_intensity = np.where(
+                relative_period < 0, 0.0,
+                np.maximum(0.0, np.where(relative_period >= duration, residual,
+                                         np.where(relative_period <= peak_period, ramp, decay)))
+            )
+            series['panic_intensity'][:, t] = panic_intensity
             
-            # Update agent behaviors based on panic
-            self._update_agent_behaviors(agent_states, t, panic_intensity, results)
+            # Retail investors
+            retail_panic = np.where(panic_intensity > p['retail_panic_threshold'],
+                                    np.minimum(1.0, retail_panic + panic_intensity * 0.5),
+                                    np.maximum(0.0, retail_panic - 0.1))
+            base_sell_rate = retail_panic * p['retail_sell_probability']
+            herd_effect = retail_panic * p['retail_herd_multiplier']
+            retail_sell_rate = np.minimum(1.0, base_sell_rate * (1 + herd_effect))
+            series['retail_sell_rate'][:, t] = retail_sell_rate
             
-            # Update asset prices based on agent actions
-            self._update_asset_prices(results, t, agent_states, panic_intensity)
+            # Whales coordinate during high panic
+            high_panic = panic_intensity > 0.3
+            whale_coordination = np.where(
+                high_panic,
+                np.minimum(1.0, whale_coordination + p['whale_coordination_prob'] * panic_intensity),
+                np.maximum(0.0, whale_coordination - 0.2)
+            )
+            whale_draws = np.zeros(n)
+            for i in np.flatnonzero(high_panic).tolist():
+                whale_draws[i] = rngs[i].uniform(-1, 1)
+            whale_intent = np.where(high_panic, whale_draws * whale_coordination, whale_intent * 0.8)
+            series['whale_activity'][:, t] = np.abs(whale_intent)
             
-            # Update exchange states (liquidity and freezes)
-            self._update_exchange_states(results, t, agent_states, panic_intensity)
+            withdrawal_pressure = panic_intensity * (1 + retail_sell_rate)
             
-            # Calculate fear & greed index
-            results['doge_social_media_index'][t] = self._calculate_doge_social_media_index(results, t, panic_intensity)
+            if t > 0:
+                cls._update_asset_prices(series, t, p, rngs, panic_intensity,
+                                          retail_sell_rate, whale_intent)
             
-            # Print progress
-            if t % 5 == 0 or panic_intensity > 0:
-                self._print_daily_update(t, results, panic_intensity)
-        
-        # Calculate summary statistics
-        summary = self._calculate_summary(results, panic)
-        results['summary'] = summary
-        
-        logger.info("Crypto panic simulation completed")
-        return results
-    
-    def _initialize_agents(self) -> Dict[str, Any]:
-        """Initialize agent states."""
-        return {
-            'retail_investors': {
-                'count': self.parameters['num_retail_investors'],
-                'panic_state': 0.0,  # 0 = calm, 1 = full panic
-                'average_holding_btc': 0.1,  # 0.1 BTC average
-                'average_holding_eth': 2.0,   # 2 ETH average
-            },
-            'whales': {
-                'count': self.parameters['num_whales'],
-                'coordination_level': 0.0,  # 0 = no coordination, 1 = full coordination
-                'average_holding_btc': self.parameters['whale_average_holding'],
-                'manipulation_intent': 0.0,  # -1 = bearish, +1 = bullish
-            },
-            'exchanges': {
-                'count': self.parameters['num_exchanges'],
-                'liquidity_reserves': np.full(self.parameters['num_exchanges'], 1.0),  # Normalized
-                'operational_status': np.ones(self.parameters['num_exchanges']),  # 1 = operational, 0 = frozen
-                'withdrawal_pressure': np.zeros(self.parameters['num_exchanges']),
-            },
-            'influencers': {
-                'count': self.parameters['num_influencers'],
-                'social_media_influence': np.zeros(self.parameters['num_influencers']),
-            }
-        }
-    
-    def _calculate_panic_intensity(self, period: int, panic: CryptoPanicShock) -> float:
-        """Calculate panic intensity at given period."""
-        if period < panic.start_period:
-            return 0.0
-        elif period < panic.start_period + panic.panic_duration:
-            # Peak panic in the middle, tapering off
-            relative_period = period - panic.start_period
-            peak_period = panic.panic_duration // 2
-            if relative_period <= peak_period:
-                # Ramp up to peak
-                intensity = panic.trigger_intensity * (relative_period / peak_period)
-            else:
-                # Decay from peak
-                decay_factor = (panic.panic_duration - relative_period) / (panic.panic_duration - peak_period)
-                intensity = panic.trigger_intensity * decay_factor
-            return max(0.0, intensity)
-        else:
-            # Post-panic recovery with exponential decay
-            recovery_period = period - panic.start_period - panic.panic_duration
-            decay_rate = 0.2  # 20% decay per period
-            residual_panic = panic.trigger_intensity * 0.1 * np.exp(-decay_rate * recovery_period)
-            return max(0.0, residual_panic)
-    
-    def _update_agent_behaviors(self, agent_states: Dict[str, Any], period: int, 
-                               panic_intensity: float, results: Dict[str, Any]):
-        """Update agent behaviors based on current market conditions."""
-        
-        # Update retail investor behavior
-        retail = agent_states['retail_investors']
-        if panic_intensity > self.parameters['retail_panic_threshold']:
-            retail['panic_state'] = min(1.0, retail['panic_state'] + panic_intensity * 0.5)
-        else:
-            retail['panic_state'] = max(0.0, retail['panic_state'] - 0.1)  # Gradual recovery
-        
-        # Retail sell rate based on panic state and herd behavior
-        base_sell_rate = retail['panic_state'] * self.parameters['retail_sell_probability']
-        herd_effect = retail['panic_state'] * self.parameters['retail_herd_multiplier']
-        results['retail_sell_rate'][period] = min(1.0, base_sell_rate * (1 + herd_effect))
-        
-        # Update whale behavior
-        whales = agent_states['whales']
-        # Whales may coordinate during high panic (contrarian or momentum)
-        if panic_intensity > 0.3:
-            coordination_prob = self.parameters['whale_coordination_prob'] * panic_intensity
-            whales['coordination_level'] = min(1.0, whales['coordination_level'] + coordination_prob)
-            # Random manipulation intent (-1 to +1)
-            whales['manipulation_intent'] = np.random.uniform(-1, 1) * whales['coordination_level']
-        else:
-            whales['coordination_level'] = max(0.0, whales['coordination_level'] - 0.2)
-            whales['manipulation_intent'] *= 0.8  # Decay manipulation intent
-        
-        results['whale_activity'][period] = abs(whales['manipulation_intent'])
-        
-        # Update exchange withdrawal pressure
-        exchanges = agent_states['exchanges']
-        withdrawal_pressure = panic_intensity * (1 + results['retail_sell_rate'][period])
-        exchanges['withdrawal_pressure'] = np.full(len(exchanges['withdrawal_pressure']), withdrawal_pressure)
+            # Exchange liquidity and freezes
+            drained = np.maximum(0.0, reserves - withdrawal_pressure * 0.1)
+            recovering = operational & (withdrawal_pressure < 0.1)
+            drained = np.where(recovering, np.minimum(1.0, drained + p['exchange_recovery_rate']), drained)
+            reserves = np.where(operational, drained, reserves)
+            freezing = operational & (reserves < p['exchange_freeze_threshold'])
+            resuming = ~operational & (reserves > 0.8)
+            operational = (operational & ~freezing) | resuming
+            series['exchange_liquidity'][:, t] = reserves
+            series['exchanges_frozen'][:, t] = np.where(operational, 0.0, p['num_exchanges'])
+            
+            # DOGE social media index (0 = extreme fear, 100 = extreme greed)
+            if t > 0:
+                doge_price = series['doge_price']
+                doge_change = (doge_price[:, t] - doge_price[:, t - 1]) / doge_price[:, t - 1]
+                doge_social_media = (
+                    (50 + (doge_change * 1000)) * 0.4 +
+                    (50 - (panic_intensity * 40)) * 0.3 +
+                    (reserves * 50) * 0.2 +
+                    (series['doge_social_media_index'][:, t - 1] + (panic_intensity * 0.05)) * 0.1
+                )
+                series['doge_social_media_index'][:, t] = np.clip(doge_social_media, 0, 100)
+        
+        scenario_results = []
+        for i, (model, panic) in enumerate(zip(models, panics)):
+            model_periods = model.parameters['periods']
+            results = {'periods': list(range(model_periods))}
+            results.update((key, values[i, :model_periods]) for key, values in series.items())
+            results['summary'] = model._calculate_summary(results, panic)
+            scenario_results.append(results)
+        
+        return scenario_results
     
-    def _update_asset_prices(self, results: Dict[str, Any], period: int, 
-                            agent_states: Dict[str, Any], panic_intensity: float):
-        """Update asset prices based on agent actions and market dynamics."""
-        
-        if period == 0:
-            # Initialize liquidation volume for period 0
-            results['liquidation_volume'] = np.zeros(len(results['periods']))
-            return  # Keep initial prices for period 0
-        
-        # Previous prices
-        prev_btc = results['btc_price'][period - 1]
-        prev_eth = results['eth_price'][period - 1]
-        prev_doge = results['doge_price'][period - 1]
-        
-        # Base volatility
-        btc_volatility = self.parameters['price_volatility_base'] * (1 + panic_intensity * 2)
-        eth_volatility = self.parameters['price_volatility_base'] * (1 + panic_intensity * 2.5)
-        doge_volatility = self.parameters['price_volatility_base'] * self.parameters['doge_volatility_multiplier'] * (1 + panic_intensity * 3)
-        
-        # Retail selling pressure
-        retail_sell_pressure = results['retail_sell_rate'][period] * 0.1  # Max 10% price impact
-        
-        # Whale manipulation impact
-        whale_impact = agent_states['whales']['manipulation_intent'] * 0.05  # Max 5% price impact
-        whale_doge_impact = whale_impact * self.parameters['whale_doge_pump_power']  # Whales can pump DOGE more
-        
-        # Exchange liquidity impact
-        liquidity_factor = results['exchange_liquidity'][period - 1] if period > 0 else 1.0
-        liquidity_impact = (1 - liquidity_factor) * 0.2  # Reduced liquidity amplifies moves
-        
-        # DOGE-specific social media and celebrity effects
-        doge_social_media_effect = 0.0
-        if np.random.random() < self.parameters['doge_celebrity_effect']:
-            doge_social_media_effect = np.random.uniform(-0.15, 0.3)  # Celebrity tweets can pump DOGE
-        
-        # Random DOGE pump probability
-        doge_random_pump = 0.0
-        if np.random.random() < self.parameters['doge_pump_probability']:
-            doge_random_pump = np.random.uniform(0.1, 0.5)  # Random 10-50% pump
-        
-        # BTC price calculation
-        btc_change = (
-            np.random.normal(0, btc_volatility) -  # Random walk
-            retail_sell_pressure +                 # Retail selling pressure (negative)
-            whale_impact -                         # Whale manipulation
-            liquidity_impact                       # Liquidity impact (negative)
-        )
-        
-        # ETH price calculation (correlated with BTC)
-        eth_correlation = self.parameters['btc_to_eth_correlation']
-        eth_independent = np.random.normal(0, eth_volatility) * (1 - eth_correlation)
-        eth_correlated = btc_change * eth_correlation
+    @staticmethod
+    def _update_asset_prices(series: Dict[str, np.ndarray], period: int, p: Dict[str, np.ndarray],
+                             rngs: List[np.random.RandomState], panic_intensity: np.ndarray,
+                             retail_sell_rate: np.ndarray, whale_intent: np.ndarray):
+        """Update asset prices, volumes and liquidations of every scenario for one period."""
+        n = panic_intensity.shape[0]
+        btc_volatility = p['price_volatility_base'] * (1 + panic_intensity * 2)
+        eth_volatility = p['price_volatility_base'] * (1 + panic_intensity * 2.5)
+        doge_volatility = p['price_volatility_base'] * p['doge_volatility_multiplier'] * (1 + panic_intensity * 3)
+        
+        # Random draws in the order simulate makes them, per scenario
+        doge_social_media_effect = np.zeros(n)
+        doge_random_pump = np.zeros(n)
+        btc_noise = np.empty(n)
+        eth_noise = np.empty(n)
+        doge_noise = np.empty(n)
+        for i, rng in enumerate(rngs):
+            if rng.random_sample() < p['doge_celebrity_effect'][i]:
+                doge_social_media_effect[i] = rng.uniform(-0.15, 0.3)
+            if rng.random_sample() < p['doge_pump_probability'][i]:
+                doge_random_pump[i] = rng.uniform(0.1, 0.5)
+            btc_noise[i] = rng.normal(0, btc_volatility[i])
+            eth_noise[i] = rng.normal(0, eth_volatility[i])
+            doge_noise[i] = rng.normal(0, doge_volatility[i])
+        
+        retail_sell_pressure = retail_sell_rate * 0.1
+        whale_impact = whale_intent * 0.05
+        whale_doge_impact = whale_impact * p['whale_doge_pump_power']
+        liquidity_impact = (1 - series['exchange_liquidity'][:, period - 1]) * 0.2
+        
+        btc_change = btc_noise - retail_sell_pressure + whale_impact - liquidity_impact
+        
+        eth_correlation = p['btc_to_eth_correlation']
         eth_change = (
-            eth_correlated + eth_independent -
-            retail_sell_pressure * 1.2 +          # ETH more sensitive to retail
-            whale_impact * 0.8 -                  # Less whale impact on ETH
+            btc_change * eth_correlation + eth_noise * (1 - eth_correlation) -
+            retail_sell_pressure * 1.2 +
+            whale_impact * 0.8 -
             liquidity_impact
         )
         
-        # DOGE price calculation (less correlated, more volatile)
-        doge_btc_correlation = self.parameters['btc_to_doge_correlation']
-        doge_eth_correlation = self.parameters['eth_to_doge_correlation']
-        doge_independent = np.random.normal(0, doge_volatility) * (1 - doge_btc_correlation - doge_eth_correlation)
-        doge_btc_correlated = btc_change * doge_btc_correlation
-        doge_eth_correlated = eth_change * doge_eth_correlation
-        
+        doge_btc_correlation = p['btc_to_doge_correlation']
+        doge_eth_correlation = p['eth_to_doge_correlation']
         doge_change = (
-            doge_btc_correlated + doge_eth_correlated + doge_independent -
-            retail_sell_pressure * self.parameters['retail_doge_fomo'] +  # DOGE FOMO effect
-            whale_doge_impact +                    # Enhanced whale impact on DOGE
-            doge_social_media_effect +             # Celebrity/social media effect
-            doge_random_pump -                     # Random pumps
-            liquidity_impact * 1.5                 # DOGE more sensitive to liquidity
+            btc_change * doge_btc_correlation + eth_change * doge_eth_correlation +
+            doge_noise * (1 - doge_btc_correlation - doge_eth_correlation) -
+            retail_sell_pressure * p['retail_doge_fomo'] +
+            whale_doge_impact +
+            doge_social_media_effect +
+            doge_random_pump -
+            liquidity_impact * 1.5
         )
         
-        # Apply changes to prices
-        results['btc_price'][period] = max(prev_btc * (1 + btc_change), prev_btc * 0.01)  # Floor at 1% of previous
-        results['eth_price'][period] = max(prev_eth * (1 + eth_change), prev_eth * 0.01)
-        results['doge_price'][period] = max(prev_doge * (1 + doge_change), prev_doge * 0.001)  # Lower floor for DOGE
-        
-        # Calculate trading volumes (higher during panic and price moves)
-        volume_multiplier = 1 + panic_intensity * 3 + abs(btc_change) * 10
-        
-        btc_market_cap = results['btc_price'][period] * self.parameters['btc_supply']
-        eth_market_cap = results['eth_price'][period] * self.parameters['eth_supply']
-        doge_market_cap = results['doge_price'][period] * self.parameters['doge_supply']
-        
-        results['btc_volume'][period] = btc_market_cap * 0.02 * volume_multiplier  # 2% daily turnover base
-        results['eth_volume'][period] = eth_market_cap * 0.03 * volume_multiplier  # 3% daily turnover base
-        results['doge_volume'][period] = doge_market_cap * 0.05 * volume_multiplier  # 5% daily turnover base (higher for meme coin)
-        
-        # Calculate liquidation volume
-        total_volume = results['btc_volume'][period] + results['eth_volume'][period] + results['doge_volume'][period]
-        liquidation_rate = panic_intensity * 0.1  # Up to 10% of volume in liquidations
-        results['liquidation_volume'][period] = total_volume * liquidation_rate
-    
-    def _update_exchange_states(self, results: Dict[str, Any], period: int,
-                               agent_states: Dict[str, Any], panic_intensity: float):
-        """Update exchange liquidity and operational status."""
-        
-        exchanges = agent_states['exchanges']
-        
-        # Update liquidity based on withdrawal pressure
-        for i in range(len(exchanges['liquidity_reserves'])):
-            if exchanges['operational_status'][i] > 0:  # Only if operational
-                withdrawal_impact = exchanges['withdrawal_pressure'][i] * 0.1
-                exchanges['liquidity_reserves'][i] = max(0.0, 
-                    exchanges['liquidity_reserves'][i] - withdrawal_impact)
-                
-                # Recovery if no pressure
-                if exchanges['withdrawal_pressure'][i] < 0.1:
-                    exchanges['liquidity_reserves'][i] = min(1.0,
-                        exchanges['liquidity_reserves'][i] + self.parameters['exchange_recovery_rate'])
-        
-        # Check for exchange freezes
-        freeze_threshold = self.parameters['exchange_freeze_threshold']
-        for i in range(len(exchanges['operational_status'])):
-            if (exchanges['liquidity_reserves'][i] < freeze_threshold and 
-                exchanges['operational_status'][i] > 0):
-                exchanges['operational_status'][i] = 0  # Freeze exchange
-                logger.info(f"Exchange {i+1} frozen due to liquidity shortage at period {period}")
-            elif (exchanges['liquidity_reserves'][i] > 0.8 and 
-                  exchanges['operational_status'][i] == 0):
-                exchanges['operational_status'][i] = 1  # Unfreeze exchange
-                logger.info(f"Exchange {i+1} resumed operations at period {period}")
-        
-        # Aggregate metrics
-        results['exchange_liquidity'][period] = np.mean(exchanges['liquidity_reserves'])
-        results['exchanges_frozen'][period] = np.sum(exchanges['operational_status'] == 0)
-    
-    def _calculate_doge_social_media_index(self, results: Dict[str, Any], period: int, panic_intensity: float) -> float:
-        """Calculate a DOGE social media index (0 = extreme fear, 100 = extreme greed)."""
-        
-        if period == 0:
-            return 50.0  # Neutral
-        
-        # Components of fear/greed
-        # 1. Price momentum
-        doge_change = (results['doge_price'][period] - results['doge_price'][period-1]) / results['doge_price'][period-1]
-        price_momentum_score = 50 + (doge_change * 1000)  # Scale price change
-        
-        # 2. Panic intensity (inverse)
-        panic_score = 50 - (panic_intensity * 40)  # High panic = low score
+        prev_btc = series['btc_price'][:, period - 1]
+        prev_eth = series['eth_price'][:, period - 1]
+        prev_doge = series['doge_price'][:, period - 1]
+        btc_price = series['btc_price'][:, period] = np.maximum(prev_btc * (1 + btc_change), prev_btc * 0.01)
+        eth_price = series['eth_price'][:, period] = np.maximum(prev_eth * (1 + eth_change), prev_eth * 0.01)
+        doge_price = series['doge_price'][:, period] = np.maximum(prev_doge * (1 + doge_change), prev_doge * 0.001)
         
-        # 3. Exchange health
-        exchange_health = results['exchange_liquidity'][period] * 50
-        
-        # 4. DOGE social media influence
-        social_media_influence = results['doge_social_media_index'][period-1] + (panic_intensity * 0.05)
-        
-        # Weighted average
-        doge_social_media = (
-            price_momentum_score * 0.4 +
-            panic_score * 0.3 +
-            exchange_health * 0.2 +
-            social_media_influence * 0.1
-        )
+        volume_multiplier = 1 + panic_intensity * 3 + np.abs(btc_change) * 10
+        btc_volume = series['btc_volume'][:, period] = btc_price * p['btc_supply'] * 0.02 * volume_multiplier
+        eth_volume = series['eth_volume'][:, period] = eth_price * p['eth_supply'] * 0.03 * volume_multiplier
+        doge_volume = series['doge_volume'][:, period] = doge_price * p['doge_supply'] * 0.05 * volume_multiplier
         
-        return np.clip(doge_social_media, 0, 100)
+        series['liquidation_volume'][:, period] = (btc_volume + eth_volume + doge_volume) * (panic_intensity * 0.1)
     
     def _print_daily_update(self, period: int, results: Dict[str, Any], panic_intensity: float):
         """Print daily simulation update."""
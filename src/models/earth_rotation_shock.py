@@ -7,9 +7,18 @@ on GDP, agriculture, infrastructure, climate, and human adaptation.
 
 import numpy as np
 import logging
+import math
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 
+try:
+    # Relative import when models is used as part of the src package
+    from ..utils._numba_compat import NUMBA_AVAILABLE, njit
+except ImportError:
+    # Absolute import when src/ itself is on sys.path (tests, demos)
+    from utils._numba_compat import NUMBA_AVAILABLE, njit
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,32 +33,22 @@ class EarthRotationShock:
     start_period: int = 0           # When the rotation change begins
 
 
-def simulate_earth_rotation_shock(rotation_change_percent: float, initial_gdp: float,
-                                gdp_day_night_dependency: float, infrastructure_adaptability: float,
-                                agricultural_sensitivity: float, climate_volatility_multiplier: float) -> Dict[str, Any]:
+# Order of the values returned by _earth_rotation_shock_values
+_ASSESSMENT_KEYS = (
+    'new_day_length_hours', 'initial_gdp_loss', 'long_term_gdp_loss', 'adaptation_time_years',
+    'sea_level_shift_meters', 'climate_volatility_index', 'labor_productivity_change',
+    'circadian_stress_index', 'sea_wave_intensity_change', 'population_drop_percent'
+)
+
+
+def _earth_rotation_shock_formula(rotation_change_percent, initial_gdp, gdp_day_night_dependency,
+                                  infrastructure_adaptability, agricultural_sensitivity,
+                                  climate_volatility_multiplier) -> tuple:
     """
-    Simple, interpretable function to simulate the effect of Earth rotation speed change.
+    Closed-form assessment shared by the scalar and batch functions.
     
-    Args:
-        rotation_change_percent: Percentage change in rotation speed (positive = faster)
-        initial_gdp: Initial global GDP (USD)
-        gdp_day_night_dependency: How much GDP depends on day/night cycles (0-1)
-        infrastructure_adaptability: How well infrastructure can adapt (0-1)
-        agricultural_sensitivity: Agricultural sensitivity to day length changes (0-1)
-        climate_volatility_multiplier: Climate instability multiplier
-        
-    Returns:
-        Dict containing:
-        - new_day_length_hours: New day length in hours
-        - initial_gdp_loss: Immediate GDP impact (%)
-        - long_term_gdp_loss: Long-term GDP impact (%)
-        - adaptation_time_years: Time to adapt (years)
-        - sea_level_shift_meters: Estimated sea level shift at equator (meters)
-        - climate_volatility_index: Climate instability index
-        - labor_productivity_change: Labor productivity change (%)
-        - circadian_stress_index: Human circadian disruption index (0-1)
-        - sea_wave_intensity_change: Change in ocean wave intensity (%)
-        - population_drop_percent: Estimated population decline (%)
+    Works elementwise on floats or broadcastable arrays; returns the values
+    in _ASSESSMENT_KEYS order.
     """
     # Calculate new day length
     # If rotation increases by X%, day length decreases by X/(1+X/100)%
@@ -59,7 +58,7 @@ def simulate_earth_rotation_shock(rotation_change_percent: float, initial_gdp: f
     
     # Immediate GDP impact from disruption
     # Based on day/night dependency, infrastructure adaptability, and agricultural sensitivity
-    disruption_factor = abs(day_length_change_percent) / 100
+    disruption_factor = np.abs(day_length_change_percent) / 100
     
     # Infrastructure disruption (immediate)
     infrastructure_impact = disruption_factor * (1 - infrastructure_adaptability) * 0.15  # Up to 15% GDP
@@ -68,7 +67,7 @@ def simulate_earth_rotation_shock(rotation_change_percent: float, initial_gdp: f
     agricultural_impact = disruption_factor * agricultural_sensitivity * 0.25  # Up to 25% of ag GDP (5% total)
     
     # Circadian and productivity disruption
-    circadian_disruption = min(1.0, disruption_factor * 2)  # Severe for large changes
+    circadian_disruption = np.minimum(1.0, disruption_factor * 2)  # Severe for large changes
     productivity_impact = circadian_disruption * gdp_day_night_dependency * 0.1  # Up to 10% GDP
     
     # Time system misalignment costs
@@ -111,20 +110,210 @@ def simulate_earth_rotation_shock(rotation_change_percent: float, initial_gdp: f
     adaptation_stress = (1 - adaptation_efficiency) * disruption_factor * 100
     
     total_stress = climate_stress + agricultural_stress + adaptation_stress
-    population_drop_percent = min(50, total_stress * 0.1)  # Cap at 50% for extreme scenarios
+    population_drop_percent = np.minimum(50.0, total_stress * 0.1)  # Cap at 50% for extreme scenarios
+    
+    return (
+        new_day_length_hours,
+        initial_gdp_loss,
+        long_term_gdp_loss,
+        adaptation_time_years,
+        sea_level_shift_meters,
+        climate_volatility_index,
+        labor_productivity_change,
+        circadian_disruption,
+        sea_wave_intensity_change,
+        population_drop_percent
+    )
+
+
+@lru_cache(maxsize=128)
+def _earth_rotation_shock_values(rotation_change_percent: float, initial_gdp: float,
+                                 gdp_day_night_dependency: float, infrastructure_adaptability: float,
+                                 agricultural_sensitivity: float,
+                                 climate_volatility_multiplier: float) -> tuple:
+    """Memoized scalar assessment, in _ASSESSMENT_KEYS order."""
+    return tuple(float(value) for value in _earth_rotation_shock_formula(
+        rotation_change_percent, initial_gdp, gdp_day_night_dependency,
+        infrastructure_adaptability, agricultural_sensitivity, climate_volatility_multiplier
+    ))
+
+
+def simulate_earth_rotation_shock(rotation_change_percent: float, initial_gdp: float,
+                                gdp_day_night_dependency: float, infrastructure_adaptability: float,
+                                agricultural_sensitivity: float, climate_volatility_multiplier: float) -> Dict[str, Any]:
+    """
+    Simple, interpretable function to simulate the effect of Earth rotation speed change.
     
-    return {
-        'new_day_length_hours': new_day_length_hours,
-        'initial_gdp_loss': initial_gdp_loss,
-        'long_term_gdp_loss': long_term_gdp_loss,
-        'adaptation_time_years': adaptation_time_years,
-        'sea_level_shift_meters': sea_level_shift_meters,
-        'climate_volatility_index': climate_volatility_index,
-        'labor_productivity_change': labor_productivity_change,
-        'circadian_stress_index': circadian_disruption,
-        'sea_wave_intensity_change': sea_wave_intensity_change,
-        'population_drop_percent': population_drop_percent
-    }
+    Results are cached, so repeated calls with the same arguments skip the
+    calculation; each call still returns a new dict.
+    
+    Args:
+        rotation_change_percent: Percentage change in rotation speed (positive = faster)
+        initial_gdp: Initial global GDP (USD)
+        gdp_day_night_dependency: How much GDP depends on day/night cycles (0-1)
+        infrastructure_adaptability: How well infrastructure can adapt (0-1)
+        agricultural_sensitivity: Agricultural sensitivity to day length changes (0-1)
+        climate_volatility_multiplier: Climate instability multiplier
+        
+    Returns:
+        Dict containing:
+        - new_day_length_hours: New day length in hours
+        - initial_gdp_loss: Immediate GDP impact (%)
+        - long_term_gdp_loss: Long-term GDP impact (%)
+        - adaptation_time_years: Time to adapt (years)
+        - sea_level_shift_meters: Estimated sea level shift at equator (meters)
+        - climate_volatility_index: Climate instability index
+        - labor_productivity_change: Labor productivity change (%)
+        - circadian_stress_index: Human circadian disruption index (0-1)
+        - sea_wave_intensity_change: Change in ocean wave intensity (%)
+        - population_drop_percent: Estimated population decline (%)
+    """
+    return dict(zip(_ASSESSMENT_KEYS, _earth_rotation_shock_values(
+        rotation_change_percent, initial_gdp, gdp_day_night_dependency,
+        infrastructure_adaptability, agricultural_sensitivity, climate_volatility_multiplier
+    )))
+
+
+def simulate_earth_rotation_shock_batch(rotation_change_percent: np.ndarray,
+                                        initial_gdp: np.ndarray = 100_000_000_000_000.0,
+                                        gdp_day_night_dependency: np.ndarray = 0.3,
+                                        infrastructure_adaptability: np.ndarray = 0.5,
+                                        agricultural_sensitivity: np.ndarray = 0.7,
+                                        climate_volatility_multiplier: np.ndarray = 1.2) -> Dict[str, np.ndarray]:
+    """
+    Vectorized ``simulate_earth_rotation_shock`` over many scenarios.
+    
+    Every argument may be a scalar or an array; they are broadcast against
+    each other, so a sweep over rotation changes only needs an array for
+    ``rotation_change_percent``. Defaults match the model's defaults.
+    
+    Args:
+        rotation_change_percent: Percentage change in rotation speed per scenario
+        initial_gdp: Initial global GDP (USD)
+        gdp_day_night_dependency: How much GDP depends on day/night cycles (0-1)
+        infrastructure_adaptability: How well infrastructure can adapt (0-1)
+        agricultural_sensitivity: Agricultural sensitivity to day length changes (0-1)
+        climate_volatility_multiplier: Climate instability multiplier
+        
+    Returns:
+        Dict with the keys of ``simulate_earth_rotation_shock``, each an
+        array with one value per scenario
+    """
+    arrays = np.broadcast_arrays(*(
+        np.asarray(value, dtype=np.float64)
+        for value in (rotation_change_percent, initial_gdp, gdp_day_night_dependency,
+                      infrastructure_adaptability, agricultural_sensitivity,
+                      climate_volatility_multiplier)
+    ))
+    return dict(zip(_ASSESSMENT_KEYS, _earth_rotation_shock_formula(*arrays)))
+
+
+# Rows of the array filled by _rotation_paths, one time series each
+_PATH_KEYS = (
+    'day_length_hours', 'gdp', 'gdp_growth', 'agricultural_productivity',
+    'infrastructure_adaptation', 'climate_volatility_index', 'circadian_stress_index',
+    'labor_productivity', 'sea_level_shift', 'adaptation_progress',
+    'population_level', 'sea_wave_intensity'
+)
+(_DAY_LENGTH, _GDP, _GDP_GROWTH, _AGRICULTURE, _INFRASTRUCTURE, _CLIMATE,
+ _CIRCADIAN, _LABOR, _SEA_LEVEL, _ADAPTATION, _POPULATION, _SEA_WAVE) = range(len(_PATH_KEYS))
+
+# Runs at least this long use the compiled kernel; shorter ones finish
+# faster in the interpreter than the one-off JIT compile takes
+_NUMBA_MIN_PERIODS = 10_000
+
+
+def _rotation_paths(paths: np.ndarray, start_period: int, new_day_length: float,
+                    baseline_day_length: float, initial_gdp: float, baseline_growth: float,
+                    rotation_change_percent: float, agriculture_loss_rate: float,
+                    infrastructure_disruption_index: float, climate_volatility_multiplier: float,
+                    adaptation_efficiency_improvement: float, circadian_disruption_multiplier: float,
+                    sea_level_sensitivity: float, ocean_current_sensitivity: float,
+                    base_adaptation_time: float) -> None:
+    """
+    Time-stepping core of ``EarthRotationShockModel.simulate``.
+    
+    ``paths`` has one row per entry of ``_PATH_KEYS`` and one column per
+    period; it is filled in place, period by period.
+    """
+    periods = paths.shape[1]
+    
+    # Baseline values, kept until the shock starts
+    paths[_DAY_LENGTH, :] = baseline_day_length
+    paths[_GDP, :] = initial_gdp
+    paths[_GDP_GROWTH, :] = baseline_growth
+    paths[_AGRICULTURE, :] = 1.0
+    paths[_INFRASTRUCTURE, :] = 1.0
+    paths[_CLIMATE, :] = 1.0
+    paths[_CIRCADIAN, :] = 0.0
+    paths[_LABOR, :] = 1.0
+    paths[_SEA_LEVEL, :] = 0.0
+    paths[_ADAPTATION, :] = 0.0
+    paths[_POPULATION, :] = 1.0
+    paths[_SEA_WAVE, :] = 1.0
+    
+    # Rotation effects that are the same in every shocked period
+    disruption_magnitude = abs(new_day_length - baseline_day_length) / baseline_day_length
+    agricultural_productivity = max(0.1, 1 - disruption_magnitude * agriculture_loss_rate)
+    infrastructure_disruption = infrastructure_disruption_index * disruption_magnitude
+    # Infrastructure never fully recovers for large shocks
+    target_adaptation = 1 - (infrastructure_disruption * 0.5)
+    climate_volatility = 1 + (rotation_change_percent / 100 * climate_volatility_multiplier)
+    max_circadian_stress = min(1.0, disruption_magnitude * circadian_disruption_multiplier)
+    sea_level_shift = (rotation_change_percent / 100) ** 2 * sea_level_sensitivity
+    sea_wave_intensity = 1 + rotation_change_percent * ocean_current_sensitivity / 100
+    # Up to 2% annual decline, driven by climate and agricultural stress
+    total_stress = ((climate_volatility - 1) + (1 - agricultural_productivity)) / 2
+    population_decline_rate = total_stress * 0.02
+    # Adaptation time scales with disruption magnitude
+    total_adaptation_time = base_adaptation_time * (1 + abs(rotation_change_percent) / 100)
+    
+    for t in range(1, periods):
+        if t >= start_period:
+            paths[_DAY_LENGTH, t] = new_day_length
+            paths[_AGRICULTURE, t] = agricultural_productivity
+            
+            # Infrastructure degrades for 5 years, then gradually adapts
+            prev_adaptation = paths[_INFRASTRUCTURE, t - 1]
+            if t <= 5:
+                paths[_INFRASTRUCTURE, t] = max(0.2, prev_adaptation - infrastructure_disruption * 0.1)
+            else:
+                recovery = (target_adaptation - prev_adaptation) * adaptation_efficiency_improvement
+                paths[_INFRASTRUCTURE, t] = min(1.0, prev_adaptation + recovery)
+            
+            paths[_CLIMATE, t] = climate_volatility
+            
+            # Circadian stress peaks early, then eases as society adapts
+            circadian_stress = max_circadian_stress * (1 - paths[_ADAPTATION, t - 1] * 0.7)
+            paths[_CIRCADIAN, t] = circadian_stress
+            paths[_LABOR, t] = 1 - (circadian_stress * 0.2)  # Up to 20% reduction
+            
+            paths[_SEA_LEVEL, t] = sea_level_shift
+            paths[_SEA_WAVE, t] = sea_wave_intensity
+            paths[_POPULATION, t] = max(0.5, paths[_POPULATION, t - 1] * (1 - population_decline_rate))
+        
+        # GDP growth from the shares of the economy each effect touches
+        ag_impact = (paths[_AGRICULTURE, t] - 1) * 0.05  # 5% of GDP is agriculture
+        infrastructure_impact = (paths[_INFRASTRUCTURE, t] - 1) * 0.2  # 20% of GDP affected
+        labor_impact = (paths[_LABOR, t] - 1) * 0.6  # 60% of GDP is labor-dependent
+        climate_impact = -(paths[_CLIMATE, t] - 1) * 0.1  # 10% GDP impact from climate
+        population_impact = (paths[_POPULATION, t] - 1) * 0.3  # 30% GDP scales with population
+        
+        total_impact = ag_impact + infrastructure_impact + labor_impact + climate_impact + population_impact
+        growth = max(-0.3, baseline_growth + total_impact)  # Floor at -30%
+        paths[_GDP_GROWTH, t] = growth
+        paths[_GDP, t] = paths[_GDP, t - 1] * (1 + growth)
+        
+        # Adaptation progress (S-curve: slow start, rapid middle, slow end)
+        if t < total_adaptation_time:
+            x = (t / total_adaptation_time) * 10 - 5  # Scale to -5 to +5
+            paths[_ADAPTATION, t] = 1 / (1 + math.exp(-x))
+        else:
+            paths[_ADAPTATION, t] = 1.0
+
+
+# JIT-compiled variant, used for runs of at least _NUMBA_MIN_PERIODS
+_rotation_paths_compiled = njit(_rotation_paths)
 
 
 class EarthRotationShockModel:
@@ -229,47 +418,31 @@ class EarthRotationShockModel:
         rotation_factor = 1 + (shock.rotation_change_percent / 100)
         new_day_length = self.parameters['baseline_day_length'] / rotation_factor
         
-        # Initialize time series
+        # Fill every time series in one pass over the periods
+        params = self.parameters
+        paths = np.empty((len(_PATH_KEYS), periods))
+        simulate_paths = _rotation_paths
+        if NUMBA_AVAILABLE and periods >= _NUMBA_MIN_PERIODS:
+            simulate_paths = _rotation_paths_compiled
+        simulate_paths(
+            paths, int(shock.start_period), float(new_day_length),
+            float(params['baseline_day_length']), float(params['initial_gdp']),
+            float(params['baseline_gdp_growth']), float(shock.rotation_change_percent),
+            float(shock.agriculture_loss_rate), float(shock.infrastructure_disruption_index),
+            float(shock.climate_volatility_multiplier),
+            float(params['adaptation_efficiency_improvement']),
+            float(params['circadian_disruption_multiplier']),
+            float(params['sea_level_sensitivity']), float(params['ocean_current_sensitivity']),
+            float(params['base_adaptation_time'])
+        )
+        
+        # Lists for JSON serialization
+        rotation_active = np.arange(periods) >= shock.start_period
         results = {
             'periods': list(range(periods)),
-            'rotation_active': np.zeros(periods, dtype=bool),
-            'day_length_hours': np.full(periods, self.parameters['baseline_day_length']),
-            'gdp': np.full(periods, self.parameters['initial_gdp']),
-            'gdp_growth': np.full(periods, self.parameters['baseline_gdp_growth']),
-            'agricultural_productivity': np.ones(periods),  # Normalized to 1.0
-            'infrastructure_adaptation': np.ones(periods),  # Normalized to 1.0
-            'climate_volatility_index': np.ones(periods),   # 1.0 = baseline
-            'circadian_stress_index': np.zeros(periods),    # 0 = no stress
-            'labor_productivity': np.ones(periods),         # Normalized to 1.0
-            'sea_level_shift': np.zeros(periods),           # Meters
-            'adaptation_progress': np.zeros(periods),       # 0-1 scale
-            'population_level': np.ones(periods),           # Normalized to 1.0
-            'sea_wave_intensity': np.ones(periods),         # Normalized to 1.0
+            'rotation_active': rotation_active.astype(int).tolist(),
         }
-        
-        # Apply rotation shock effects
-        for t in range(periods):
-            # Determine if shock is active
-            shock_active = t >= shock.start_period
-            results['rotation_active'][t] = shock_active
-            
-            if shock_active:
-                # Apply rotation shock effects
-                self._apply_rotation_effects(results, t, shock, new_day_length)
-            
-            # Update economic indicators
-            self._update_economic_indicators(results, t, shock)
-            
-            # Update adaptation progress
-            self._update_adaptation_progress(results, t, shock)
-        
-        # Convert numpy arrays to lists for JSON serialization
-        for key, value in results.items():
-            if isinstance(value, np.ndarray):
-                if value.dtype == bool:
-                    results[key] = value.astype(int).tolist()
-                else:
-                    results[key] = value.tolist()
+        results.update(zip(_PATH_KEYS, paths.tolist()))
         
         # Add summary statistics
         results['summary'] = self._calculate_summary(results, shock, new_day_length)
@@ -277,133 +450,6 @@ class EarthRotationShockModel:
         logger.info("Earth rotation shock simulation completed")
         return results
     
-    def _apply_rotation_effects(self, results: Dict[str, Any], period: int, 
-                              shock: EarthRotationShock, new_day_length: float):
-        """Apply the effects of Earth rotation speed change."""
-        if period == 0:
-            return
-        
-        # Day length change
-        results['day_length_hours'][period] = new_day_length
-        
-        # Calculate disruption magnitude
-        day_length_change = abs(new_day_length - self.parameters['baseline_day_length'])
-        disruption_magnitude = day_length_change / self.parameters['baseline_day_length']
-        
-        # Agricultural productivity impact
-        ag_sensitivity = shock.agriculture_loss_rate
-        ag_impact = disruption_magnitude * ag_sensitivity
-        results['agricultural_productivity'][period] = max(0.1, 1 - ag_impact)
-        
-        # Infrastructure adaptation (gradual improvement)
-        if period > 0:
-            prev_adaptation = results['infrastructure_adaptation'][period - 1]
-            adaptation_rate = self.parameters['adaptation_efficiency_improvement']
-            disruption_factor = shock.infrastructure_disruption_index * disruption_magnitude
-            
-            # Infrastructure degrades initially, then adapts
-            if period <= 5:  # First 5 years: degradation
-                results['infrastructure_adaptation'][period] = max(0.2, prev_adaptation - disruption_factor * 0.1)
-            else:  # After 5 years: gradual adaptation
-                target_adaptation = 1 - (disruption_factor * 0.5)  # Never fully recovers for large shocks
-                recovery = (target_adaptation - prev_adaptation) * adaptation_rate
-                results['infrastructure_adaptation'][period] = min(1.0, prev_adaptation + recovery)
-        else:
-            results['infrastructure_adaptation'][period] = 1.0
-        
-        # Climate volatility
-        coriolis_change = shock.rotation_change_percent / 100
-        climate_multiplier = shock.climate_volatility_multiplier
-        results['climate_volatility_index'][period] = 1 + (coriolis_change * climate_multiplier)
-        
-        # Circadian stress (peaks early, then gradual adaptation)
-        max_circadian_stress = min(1.0, disruption_magnitude * self.parameters['circadian_disruption_multiplier'])
-        adaptation_factor = results['adaptation_progress'][period - 1] if period > 0 else 0
-        results['circadian_stress_index'][period] = max_circadian_stress * (1 - adaptation_factor * 0.7)
-        
-        # Labor productivity (affected by circadian stress)
-        circadian_impact = results['circadian_stress_index'][period]
-        results['labor_productivity'][period] = 1 - (circadian_impact * 0.2)  # Up to 20% reduction
-        
-        # Sea level shift (immediate physical effect)
-        rotation_change_factor = (shock.rotation_change_percent / 100) ** 2
-        results['sea_level_shift'][period] = rotation_change_factor * self.parameters['sea_level_sensitivity']
-        
-        # Sea wave intensity
-        wave_change = shock.rotation_change_percent * self.parameters['ocean_current_sensitivity'] / 100
-        results['sea_wave_intensity'][period] = 1 + wave_change
-        
-        # Population impact (gradual, based on multiple stressors)
-        climate_stress = results['climate_volatility_index'][period] - 1
-        agricultural_stress = 1 - results['agricultural_productivity'][period]
-        total_stress = (climate_stress + agricultural_stress) / 2
-        
-        if period > 0:
-            prev_population = results['population_level'][period - 1]
-            population_decline_rate = total_stress * 0.02  # Up to 2% annual decline
-            results['population_level'][period] = max(0.5, prev_population * (1 - population_decline_rate))
-        else:
-            results['population_level'][period] = 1.0
-    
-    def _update_economic_indicators(self, results: Dict[str, Any], period: int, shock: EarthRotationShock):
-        """Update GDP and economic growth based on rotation effects."""
-        if period == 0:
-            results['gdp'][period] = self.parameters['initial_gdp']
-            results['gdp_growth'][period] = self.parameters['baseline_gdp_growth']
-            return
-        
-        baseline_growth = self.parameters['baseline_gdp_growth']
-        
-        # Agricultural impact (5% of GDP)
-        ag_productivity = results['agricultural_productivity'][period]
-        ag_impact = (ag_productivity - 1) * 0.05  # 5% of GDP is agriculture
-        
-        # Infrastructure impact
-        infrastructure_level = results['infrastructure_adaptation'][period]
-        infrastructure_impact = (infrastructure_level - 1) * 0.2  # 20% of GDP affected
-        
-        # Labor productivity impact
-        labor_productivity = results['labor_productivity'][period]
-        labor_impact = (labor_productivity - 1) * 0.6  # 60% of GDP is labor-dependent
-        
-        # Climate volatility impact
-        climate_volatility = results['climate_volatility_index'][period]
-        climate_impact = -(climate_volatility - 1) * 0.1  # 10% GDP impact from climate
-        
-        # Population impact
-        population_level = results['population_level'][period]
-        population_impact = (population_level - 1) * 0.3  # 30% GDP scales with population
-        
-        # Total growth impact
-        total_impact = ag_impact + infrastructure_impact + labor_impact + climate_impact + population_impact
-        results['gdp_growth'][period] = max(-0.3, baseline_growth + total_impact)  # Floor at -30%
-        
-        # Update GDP level
-        results['gdp'][period] = results['gdp'][period - 1] * (1 + results['gdp_growth'][period])
-    
-    def _update_adaptation_progress(self, results: Dict[str, Any], period: int, shock: EarthRotationShock):
-        """Update human and societal adaptation progress."""
-        if period == 0:
-            results['adaptation_progress'][period] = 0.0
-            return
-        
-        # Adaptation progress (S-curve: slow start, rapid middle, slow end)
-        base_adaptation_time = self.parameters['base_adaptation_time']
-        disruption_magnitude = abs(shock.rotation_change_percent) / 100
-        
-        # Adaptation time scales with disruption magnitude
-        total_adaptation_time = base_adaptation_time * (1 + disruption_magnitude)
-        
-        # S-curve adaptation function
-        if period < total_adaptation_time:
-            # Logistic function for S-curve
-            x = (period / total_adaptation_time) * 10 - 5  # Scale to -5 to +5
-            adaptation_level = 1 / (1 + np.exp(-x))
-        else:
-            adaptation_level = 1.0
-        
-        results['adaptation_progress'][period] = adaptation_level
-    
     def _calculate_summary(self, results: Dict[str, Any], shock: EarthRotationShock, 
                          new_day_length: float) -> Dict[str, Any]:
         """Calculate summary statistics for the simulation."""
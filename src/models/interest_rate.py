@@ -7,13 +7,23 @@ on various economic indicators.
 
 import numpy as np
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List
 from dataclasses import dataclass
+from types import MappingProxyType
+
+from ._shock_paths import batch_results, shock_window, stack_parameters, stacked_shock_paths
 
 logger = logging.getLogger(__name__)
 
+# Parameters stacked into one array per key by InterestRateModel.simulate_batch
+_BATCH_PARAMETER_KEYS = (
+    'gdp_sensitivity', 'inflation_sensitivity', 'investment_sensitivity',
+    'consumption_sensitivity', 'baseline_gdp_growth', 'baseline_inflation',
+    'baseline_investment', 'baseline_consumption', 'persistence'
+)
+
 
-@dataclass
+@dataclass(frozen=True)
 class InterestRateShock:
     """Configuration for an interest rate shock."""
     magnitude: float  # Percentage point change (e.g., 0.5 for 50 basis points)
@@ -32,6 +42,36 @@ class InterestRateModel:
     - Consumption patterns
     """
     
+    # Simulated time series and the parameter holding each one's baseline
+    # value (None for series that start at zero)
+    _SERIES_BASELINES = {
+        'interest_rate_shock': None,
+        'gdp_growth': 'baseline_gdp_growth',
+        'inflation': 'baseline_inflation',
+        'investment': 'baseline_investment',
+        'consumption': 'baseline_consumption',
+    }
+    
+    # Calibration used for any parameter a scenario does not set; shared by
+    # every instance, so it is built once and exposed read-only
+    _DEFAULT_PARAMETERS = MappingProxyType({
+        # Sensitivity parameters
+        'gdp_sensitivity': -0.3,      # GDP response to 1pp rate increase
+        'inflation_sensitivity': -0.2, # Inflation response to 1pp rate increase
+        'investment_sensitivity': -0.8, # Investment response to 1pp rate increase
+        'consumption_sensitivity': -0.15, # Consumption response to 1pp rate increase
+        
+        # Baseline values
+        'baseline_gdp_growth': 0.02,    # 2% quarterly growth
+        'baseline_inflation': 0.005,    # 0.5% quarterly inflation
+        'baseline_investment': 1000.0,  # Baseline investment level
+        'baseline_consumption': 5000.0, # Baseline consumption level
+        
+        # Model parameters
+        'periods': 20,                  # Number of simulation periods
+        'persistence': 0.8,            # Shock persistence factor
+    })
+    
     def __init__(self, parameters: Dict[str, Any]):
         """
         Initialize the Interest Rate Model.
@@ -44,26 +84,8 @@ class InterestRateModel:
     
     def _validate_parameters(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Validate and set default parameters."""
-        defaults = {
-            # Sensitivity parameters
-            'gdp_sensitivity': -0.3,      # GDP response to 1pp rate increase
-            'inflation_sensitivity': -0.2, # Inflation response to 1pp rate increase
-            'investment_sensitivity': -0.8, # Investment response to 1pp rate increase
-            'consumption_sensitivity': -0.15, # Consumption response to 1pp rate increase
-            
-            # Baseline values
-            'baseline_gdp_growth': 0.02,    # 2% quarterly growth
-            'baseline_inflation': 0.005,    # 0.5% quarterly inflation
-            'baseline_investment': 1000.0,  # Baseline investment level
-            'baseline_consumption': 5000.0, # Baseline consumption level
-            
-            # Model parameters
-            'periods': 20,                  # Number of simulation periods
-            'persistence': 0.8,            # Shock persistence factor
-        }
-        
         # Merge with provided parameters
-        for key, default_value in defaults.items():
+        for key, default_value in self._DEFAULT_PARAMETERS.items():
             if key not in params:
                 params[key] = default_value
         
@@ -82,12 +104,7 @@ class InterestRateModel:
         periods = self.parameters['periods']
         
         # Parse shock configuration
-        shock_config = simulation_config.get('shock', {})
-        shock = InterestRateShock(
-            magnitude=shock_config.get('magnitude', 0.0),
-            duration=shock_config.get('duration', 5),
-            start_period=shock_config.get('start_period', 0)
-        )
+        shock = self._shock_from_config(simulation_config)
         
         logger.info(f"Simulating {shock.magnitude*100:.1f} basis point shock "
                    f"for {shock.duration} periods starting at period {shock.start_period}")
@@ -95,24 +112,22 @@ class InterestRateModel:
         # Initialize time series
         results = {
             'periods': list(range(periods)),
-            'interest_rate_shock': np.zeros(periods),
-            'gdp_growth': np.full(periods, self.parameters['baseline_gdp_growth']),
-            'inflation': np.full(periods, self.parameters['baseline_inflation']),
-            'investment': np.full(periods, self.parameters['baseline_investment']),
-            'consumption': np.full(periods, self.parameters['baseline_consumption']),
+            **self._baseline_series(periods),
         }
         
-        # Apply interest rate shock
-        for t in range(periods):
-            if shock.start_period <= t < shock.start_period + shock.duration:
-                # Apply shock with persistence decay
-                shock_period = t - shock.start_period
-                persistence_factor = self.parameters['persistence'] ** shock_period
-                current_shock = shock.magnitude * persistence_factor
-                results['interest_rate_shock'][t] = current_shock
-                
-                # Calculate economic impacts
-                self._apply_shock_effects(results, t, current_shock)
+        # Apply interest rate shock to every affected period at once; the
+        # shock decays with persistence from its start period
+        window = shock_window(shock.magnitude, self.parameters['persistence'],
+                              shock.start_period, shock.duration, periods)
+        if window is not None:
+            window, current_shock = window
+            results['interest_rate_shock'][window] = current_shock
+            
+            # Calculate economic impacts
+            self._apply_shock_effects(results, window, current_shock)
+        
+        # Summary statistics are reduced from the arrays before conversion
+        summary = self._calculate_summary(results)
         
         # Convert numpy arrays to lists for JSON serialization
         for key, value in results.items():
@@ -120,13 +135,86 @@ class InterestRateModel:
                 results[key] = value.tolist()
         
         # Add summary statistics
-        results['summary'] = self._calculate_summary(results)
+        results['summary'] = summary
         
         logger.info("Interest rate shock simulation completed")
         return results
     
-    def _apply_shock_effects(self, results: Dict[str, Any], period: int, shock: float):
-        """Apply the economic effects of the interest rate shock."""
+    @classmethod
+    def simulate_batch(cls, parameters: List[Dict[str, Any]],
+                       simulation_configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run several interest rate shock simulations side by side.
+        
+        Parameters are stacked into one array per parameter with an entry per
+        scenario, and the shock paths and their effects are computed for all
+        scenarios and periods at once. Results match ``simulate`` exactly.
+        
+        Args:
+            parameters: Model calibration parameters, one dict per scenario
+            simulation_configs: Simulation configurations, one per scenario
+            
+        Returns:
+            List of result dictionaries, in the same form as ``simulate``
+        """
+        if len(parameters) != len(simulation_configs):
+            raise ValueError("parameters and simulation_configs must have the same length")
+        if not parameters:
+            return []
+        
+        # Validated parameters (defaults filled in) and shocks per scenario
+        scenario_parameters = [cls(params).parameters for params in parameters]
+        shocks = [cls._shock_from_config(config) for config in simulation_configs]
+        lengths = [params['periods'] for params in scenario_parameters]
+        
+        # Structure of arrays: column vectors with one row per scenario
+        p = stack_parameters(scenario_parameters, _BATCH_PARAMETER_KEYS)
+        
+        # Outside the shock window the shock is zero, which leaves the
+        # baselines below unchanged
+        interest_rate_shock, _ = stacked_shock_paths(
+            [(shock.magnitude, params['persistence'], shock.start_period, shock.duration)
+             for shock, params in zip(shocks, scenario_parameters)],
+            max(lengths)
+        )
+        series = {
+            'interest_rate_shock': interest_rate_shock,
+            'gdp_growth': p['baseline_gdp_growth'] + interest_rate_shock * p['gdp_sensitivity'],
+            'inflation': p['baseline_inflation'] + interest_rate_shock * p['inflation_sensitivity'],
+            'investment': p['baseline_investment'] * (
+                1 + (interest_rate_shock * p['investment_sensitivity'] / 100)),
+            'consumption': p['baseline_consumption'] * (
+                1 + (interest_rate_shock * p['consumption_sensitivity'] / 100)),
+        }
+        
+        def summarize(rows_series: Dict[str, np.ndarray], rows: np.ndarray) -> Dict[str, np.ndarray]:
+            return cls._summary_statistics(rows_series, p['baseline_investment'][rows, 0],
+                                           p['baseline_consumption'][rows, 0])
+        
+        results = batch_results(lengths, series, summarize)
+        
+        logger.info(f"Interest rate batch of {len(results)} simulations completed")
+        return results
+    
+    @staticmethod
+    def _shock_from_config(simulation_config: Dict[str, Any]) -> InterestRateShock:
+        """Build the shock described by a simulation configuration, with defaults."""
+        shock_config = simulation_config.get('shock', {})
+        return InterestRateShock(
+            magnitude=shock_config.get('magnitude', 0.0),
+            duration=shock_config.get('duration', 5),
+            start_period=shock_config.get('start_period', 0)
+        )
+    
+    def _baseline_series(self, periods: int) -> Dict[str, np.ndarray]:
+        """Return new time series arrays set to their baselines."""
+        return {
+            key: np.full(periods, 0.0 if baseline is None else self.parameters[baseline])
+            for key, baseline in self._SERIES_BASELINES.items()
+        }
+    
+    def _apply_shock_effects(self, results: Dict[str, Any], period: slice, shock: np.ndarray):
+        """Apply the economic effects of the interest rate shock over a period window."""
         # GDP growth impact
         gdp_impact = shock * self.parameters['gdp_sensitivity']
         results['gdp_growth'][period] += gdp_impact
@@ -146,21 +234,33 @@ class InterestRateModel:
         results['consumption'][period] *= consumption_multiplier
     
     def _calculate_summary(self, results: Dict[str, Any]) -> Dict[str, Any]:
-        """Calculate summary statistics for the simulation."""
-        gdp_values = np.array(results['gdp_growth'])
-        inflation_values = np.array(results['inflation'])
-        investment_values = np.array(results['investment'])
-        consumption_values = np.array(results['consumption'])
+        """Calculate summary statistics from the simulated time series arrays."""
+        statistics = self._summary_statistics(results, self.parameters['baseline_investment'],
+                                              self.parameters['baseline_consumption'])
+        return {key: float(value) for key, value in statistics.items()}
+    
+    @staticmethod
+    def _summary_statistics(results: Dict[str, Any], baseline_investment,
+                            baseline_consumption) -> Dict[str, Any]:
+        """
+        Reduce the time series over their last (period) axis.
+        
+        Works on one scenario's series or on a stack of equally long series,
+        one row per scenario, with a matching array of baselines.
+        """
+        gdp_values = results['gdp_growth']
+        inflation_values = results['inflation']
+        investment_values = results['investment']
+        consumption_values = results['consumption']
+        periods = gdp_values.shape[-1]
         
         return {
-            'avg_gdp_growth': float(np.mean(gdp_values)),
-            'min_gdp_growth': float(np.min(gdp_values)),
-            'max_gdp_growth': float(np.max(gdp_values)),
-            'avg_inflation': float(np.mean(inflation_values)),
-            'min_inflation': float(np.min(inflation_values)),
-            'max_inflation': float(np.max(inflation_values)),
-            'total_investment_change': float(np.sum(investment_values) - 
-                                           len(investment_values) * self.parameters['baseline_investment']),
-            'total_consumption_change': float(np.sum(consumption_values) - 
-                                            len(consumption_values) * self.parameters['baseline_consumption']),
-        } 
\ No newline at end of file
+            'avg_gdp_growth': np.mean(gdp_values, axis=-1),
+            'min_gdp_growth': np.min(gdp_values, axis=-1),
+            'max_gdp_growth': np.max(gdp_values, axis=-1),
+            'avg_inflation': np.mean(inflation_values, axis=-1),
+            'min_inflation': np.min(inflation_values, axis=-1),
+            'max_inflation': np.max(inflation_values, axis=-1),
+            'total_investment_change': np.sum(investment_values, axis=-1) - periods * baseline_investment,
+            'total_consumption_change': np.sum(consumption_values, axis=-1) - periods * baseline_consumption,
+        }
@@ -95,6 +95,20 @@ class PlasticSpreadSimulationModel:
     - Tipping points for ecosystem collapse
     """
     
+    # Per-scenario time series that are converted to lists for JSON output
+    _ARRAY_KEYS = (
+        'periods',
+        'annual_production_tonnes',
+        'total_plastic_accumulated_kg',
+        'earth_coverage_percent',
+        'ocean_coverage_percent',
+        'land_coverage_percent',
+        'cleanup_cost_billion_usd',
+        'environmental_damage_cost_billion_usd',
+        'recycling_rate',
+        'gdp_impact_percent'
+    )
+    
     def __init__(self, parameters: Dict[str, Any]):
         """
         Initialize the Plastic Spread Simulation Model.
@@ -103,8 +117,16 @@ class PlasticSpreadSimulationModel:
             parameters: Model calibration parameters
         """
         self.parameters = self._validate_parameters(parameters)
+        self._baseline_cumulative_tonnes = self._baseline_cumulative_production()
         logger.info("Plastic Spread Simulation Model initialized")
     
+    def _baseline_cumulative_production(self) -> float:
+        """Total net production over all periods with no interventions."""
+        # Summed from the same float64 curve the scenarios use, so a scenario
+        # whose production path is unchanged reports exactly no reduction
+        net_production = self._production_growth_curve() * (1 - self.parameters['initial_recycling_rate'])
+        return float(net_production.sum())
+    
     def _validate_parameters(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Validate and set default parameters."""
         defaults = {
@@ -165,12 +187,15 @@ class PlasticSpreadSimulationModel:
         
         logger.info(f"Simulating plastic spread over {periods} years")
         
+        # Uncapped production path, shared by every scenario
+        growth_curve = self._production_growth_curve()
+        
         if compare_scenarios:
             # Run multiple scenarios
-            baseline_scenario = self._run_single_scenario('baseline')
-            production_cap_scenario = self._run_single_scenario('production_cap')
-            recycling_improvement_scenario = self._run_single_scenario('recycling_improvement')
-            combined_intervention_scenario = self._run_single_scenario('combined_intervention')
+            baseline_scenario = self._run_single_scenario('baseline', growth_curve)
+            production_cap_scenario = self._run_single_scenario('production_cap', growth_curve)
+            recycling_improvement_scenario = self._run_single_scenario('recycling_improvement', growth_curve)
+            combined_intervention_scenario = self._run_single_scenario('combined_intervention', growth_curve)
             
             results = {
                 'baseline_scenario': baseline_scenario,
@@ -187,101 +212,99 @@ class PlasticSpreadSimulationModel:
         else:
             # Run single scenario
             scenario_type = simulation_config.get('scenario_type', 'baseline')
-            results = self._run_single_scenario(scenario_type)
+            results = self._run_single_scenario(scenario_type, growth_curve)
         
         logger.info("Plastic spread simulation completed")
         return results
     
-    def _run_single_scenario(self, scenario_type: str) -> Dict[str, Any]:
+    def _production_growth_curve(self) -> np.ndarray:
+        """Gross annual production for each period with uninterrupted compound growth."""
+        return self.parameters['annual_production_tonnes'] * (
+            (1 + self.parameters['annual_growth_rate']) ** np.arange(1, self.parameters['periods'] + 1)
+        )
+    
+    def _run_single_scenario(self, scenario_type: str,
+                             growth_curve: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """Run a single scenario simulation."""
         periods = self.parameters['periods']
+        if growth_curve is None:
+            growth_curve = self._production_growth_curve()
         
         # Configure scenario-specific parameters
         scenario_params = self._configure_scenario(scenario_type)
         
-        # Initialize time series
+        # Hoist parameter lookups
+        params = self.parameters
+        initial_production = params['annual_production_tonnes']
+        persistence_rate = params['plastic_persistence_rate']
+        ocean_allocation = params['ocean_allocation_rate']
+        gdp_threshold = params['gdp_impact_threshold']
+        
+        # Production is frozen at the (capped) previous-year level once the cap applies
+        gross_production = growth_curve
+        cap_year = max(scenario_params['production_cap_year'], 0)
+        if scenario_params['production_cap_enabled'] and cap_year < periods:
+            max_production = initial_production * scenario_params['production_cap_multiplier']
+            held_production = growth_curve[cap_year - 1] if cap_year > 0 else initial_production
+            gross_production = growth_curve.copy()
+            gross_production[cap_year:] = min(held_production, max_production)
+        
+        # Recycling rate ramps towards its target once improvements start
+        recycling_rate = np.full(periods, scenario_params['initial_recycling_rate'])
+        if scenario_params['recycling_improvement_enabled']:
+            recycling_step = scenario_params['recycling_improvement_rate']
+            target_recycling = scenario_params['target_recycling_rate']
+            for t in range(max(scenario_params['recycling_improvement_year'], 1), periods):
+                improvement = min(recycling_step, target_recycling - recycling_rate[t-1])
+                recycling_rate[t] = recycling_rate[t-1] + improvement
+        
+        # Net plastic production (after recycling) and accumulation
+        net_production = gross_production * (1 - recycling_rate)
+        cumulative_plastic = np.cumsum(net_production * 1000 * persistence_rate)
+        
+        # Earth, ocean and land coverage in one broadcast over the three surfaces
+        total_coverage_area = cumulative_plastic / params['coverage_density_kg_per_sq_km']
+        allocations = np.array([1.0, ocean_allocation, 1 - ocean_allocation])
+        areas = np.array([
+            params['earth_surface_area_sq_km'],
+            params['ocean_area_sq_km'],
+            params['land_area_sq_km']
+        ])
+        coverage = np.minimum(total_coverage_area[:, None] * allocations / areas * 100, 100)
+        earth_coverage = coverage[:, 0]
+        
+        # Economic impacts
+        cleanup_costs = (cumulative_plastic / 1000) * params['cleanup_cost_per_tonne'] / 1e9
+        damage_costs = cleanup_costs * (1 + (earth_coverage / 10) ** 2)
+        gdp_impact = np.where(
+            earth_coverage > gdp_threshold,
+            (earth_coverage - gdp_threshold) * params['gdp_impact_sensitivity'],
+            0.0
+        )
+        
+        # Store time series in single precision (ample for policy-level
+        # projections; everything above is computed in float64)
         results = {
-            'periods': list(range(periods)),
-            'annual_production_tonnes': np.zeros(periods),
-            'total_plastic_accumulated_kg': np.zeros(periods),
-            'earth_coverage_percent': np.zeros(periods),
-            'ocean_coverage_percent': np.zeros(periods),
-            'land_coverage_percent': np.zeros(periods),
-            'cleanup_cost_billion_usd': np.zeros(periods),
-            'environmental_damage_cost_billion_usd': np.zeros(periods),
-            'recycling_rate': np.full(periods, scenario_params['initial_recycling_rate']),
-            'gdp_impact_percent': np.zeros(periods),
+            'periods': np.arange(periods, dtype=np.int32),
+            'annual_production_tonnes': net_production.astype(np.float32),
+            'total_plastic_accumulated_kg': cumulative_plastic.astype(np.float32),
+            'earth_coverage_percent': earth_coverage.astype(np.float32),
+            'ocean_coverage_percent': coverage[:, 1].astype(np.float32),
+            'land_coverage_percent': coverage[:, 2].astype(np.float32),
+            'cleanup_cost_billion_usd': cleanup_costs.astype(np.float32),
+            'environmental_damage_cost_billion_usd': damage_costs.astype(np.float32),
+            'recycling_rate': recycling_rate.astype(np.float32),
+            'gdp_impact_percent': gdp_impact.astype(np.float32),
             'scenario_type': scenario_type
         }
         
-        # Run simulation year by year
-        cumulative_plastic = 0
-        current_production = self.parameters['annual_production_tonnes']
-        
-        for t in range(periods):
-            # Apply production controls if enabled
-            if scenario_params['production_cap_enabled'] and t >= scenario_params['production_cap_year']:
-                max_production = self.parameters['annual_production_tonnes'] * scenario_params['production_cap_multiplier']
-                current_production = min(current_production, max_production)
-            else:
-                current_production *= (1 + self.parameters['annual_growth_rate'])
-            
-            # Apply recycling improvements
-            if scenario_params['recycling_improvement_enabled'] and t >= scenario_params['recycling_improvement_year']:
-                improvement = min(
-                    scenario_params['recycling_improvement_rate'],
-                    scenario_params['target_recycling_rate'] - results['recycling_rate'][t-1] if t > 0 else 0
-                )
-                results['recycling_rate'][t] = results['recycling_rate'][t-1] + improvement if t > 0 else scenario_params['initial_recycling_rate']
-            
-            # Calculate net plastic production (after recycling)
-            net_production = current_production * (1 - results['recycling_rate'][t])
-            results['annual_production_tonnes'][t] = net_production
-            
-            # Accumulate plastic
-            cumulative_plastic += net_production * 1000 * self.parameters['plastic_persistence_rate']
-            results['total_plastic_accumulated_kg'][t] = cumulative_plastic
-            
-            # Calculate coverage using simple function
-            simple_result = simulate_plastic_spread(
-                annual_production_tonnes=net_production,
-                annual_growth_rate=0,  # Growth already applied above
-                coverage_density_kg_per_sq_km=self.parameters['coverage_density_kg_per_sq_km'],
-                earth_surface_area_sq_km=self.parameters['earth_surface_area_sq_km'],
-                ocean_area_sq_km=self.parameters['ocean_area_sq_km'],
-                current_year=0  # Use accumulated plastic directly
-            )
-            
-            # Override with our accumulated values
-            total_coverage_area = cumulative_plastic / self.parameters['coverage_density_kg_per_sq_km']
-            results['earth_coverage_percent'][t] = min(
-                (total_coverage_area / self.parameters['earth_surface_area_sq_km']) * 100, 100
-            )
-            results['ocean_coverage_percent'][t] = min(
-                (total_coverage_area * self.parameters['ocean_allocation_rate'] / self.parameters['ocean_area_sq_km']) * 100, 100
-            )
-            results['land_coverage_percent'][t] = min(
-                (total_coverage_area * (1 - self.parameters['ocean_allocation_rate']) / self.parameters['land_area_sq_km']) * 100, 100
-            )
-            
-            # Economic impacts
-            results['cleanup_cost_billion_usd'][t] = (cumulative_plastic / 1000) * self.parameters['cleanup_cost_per_tonne'] / 1e9
-            
-            damage_multiplier = 1 + (results['earth_coverage_percent'][t] / 10) ** 2
-            results['environmental_damage_cost_billion_usd'][t] = results['cleanup_cost_billion_usd'][t] * damage_multiplier
-            
-            # GDP impact
-            if results['earth_coverage_percent'][t] > self.parameters['gdp_impact_threshold']:
-                excess_coverage = results['earth_coverage_percent'][t] - self.parameters['gdp_impact_threshold']
-                results['gdp_impact_percent'][t] = excess_coverage * self.parameters['gdp_impact_sensitivity']
+        # Add summary statistics while the time series are still ndarrays;
+        # total production is summed before the float32 rounding above
+        results['summary'] = self._calculate_summary(results, float(net_production.sum()))
         
         # Convert numpy arrays to lists for JSON serialization
-        for key, value in results.items():
-            if isinstance(value, np.ndarray):
-                results[key] = value.tolist()
-        
-        # Add summary statistics
-        results['summary'] = self._calculate_summary(results)
+        for key in self._ARRAY_KEYS:
+            results[key] = results[key].tolist()
         
         return results
     
@@ -314,23 +337,27 @@ class PlasticSpreadSimulationModel:
         
         return base_config
     
-    def _calculate_summary(self, results: Dict[str, Any]) -> Dict[str, Any]:
+    def _calculate_summary(self, results: Dict[str, Any],
+                           cumulative_production: float) -> Dict[str, Any]:
         """Calculate summary statistics for the simulation."""
-        earth_coverage = np.array(results['earth_coverage_percent'])
-        ocean_coverage = np.array(results['ocean_coverage_percent'])
-        cleanup_costs = np.array(results['cleanup_cost_billion_usd'])
-        damage_costs = np.array(results['environmental_damage_cost_billion_usd'])
-        total_plastic = np.array(results['total_plastic_accumulated_kg'])
-        gdp_impact = np.array(results['gdp_impact_percent'])
-        
-        # Find critical thresholds
+        earth_coverage = results['earth_coverage_percent']
+        ocean_coverage = results['ocean_coverage_percent']
+        cleanup_costs = results['cleanup_cost_billion_usd']
+        damage_costs = results['environmental_damage_cost_billion_usd']
+        total_plastic = results['total_plastic_accumulated_kg']
+        gdp_impact = results['gdp_impact_percent']
+        
+        # Find critical thresholds (coverage is non-decreasing because
+        # accumulated plastic only grows, so a binary search is sufficient)
         critical_coverage_year = None
-        if np.any(earth_coverage >= 1.0):  # 1% coverage threshold
-            critical_coverage_year = int(np.argmax(earth_coverage >= 1.0))
+        idx = int(np.searchsorted(earth_coverage, 1.0))  # 1% coverage threshold
+        if idx < len(earth_coverage):
+            critical_coverage_year = idx
         
         ocean_saturation_year = None
-        if np.any(ocean_coverage >= 10.0):  # 10% ocean coverage threshold
-            ocean_saturation_year = int(np.argmax(ocean_coverage >= 10.0))
+        idx = int(np.searchsorted(ocean_coverage, 10.0))  # 10% ocean coverage threshold
+        if idx < len(ocean_coverage):
+            ocean_saturation_year = idx
         
         return {
             'final_earth_coverage_percent': float(earth_coverage[-1]),
@@ -348,11 +375,8 @@ class PlasticSpreadSimulationModel:
             'scenario_type': results['scenario_type'],
             'years_to_1_percent_coverage': critical_coverage_year,
             'cumulative_production_reduction_percent': float(
-                ((self.parameters['annual_production_tonnes'] * self.parameters['periods'] * 
-                  ((1 + self.parameters['annual_growth_rate']) ** self.parameters['periods'] - 1) / 
-                  self.parameters['annual_growth_rate']) - 
-                 np.sum(results['annual_production_tonnes'])) /
-                (self.parameters['annual_production_tonnes'] * self.parameters['periods']) * 100
+                (self._baseline_cumulative_tonnes - cumulative_production) /
+                self._baseline_cumulative_tonnes * 100
             ) if results['scenario_type'] != 'baseline' else 0.0
         }
     
@@ -367,27 +391,41 @@ class PlasticSpreadSimulationModel:
             'key_insights': []
         }
         
-        for scenario_name, scenario_data in scenarios.items():
-            if scenario_name == 'baseline':
-                continue
-            
-            summary = scenario_data['summary']
-            
+        names = [name for name in scenarios if name != 'baseline']
+        summaries = [scenarios[name]['summary'] for name in names]
+        
+        def savings(field: str) -> List[float]:
+            """Baseline minus every scenario for one summary field in a single vector op."""
+            return (baseline[field] - np.array([summary[field] for summary in summaries])).tolist()
+        
+        earth_reduction = savings('final_earth_coverage_percent')
+        ocean_reduction = savings('final_ocean_coverage_percent')
+        delayed_years = (
+            np.array([summary['critical_coverage_year'] or 999 for summary in summaries]) -
+            (baseline['critical_coverage_year'] or 999)
+        ).tolist()
+        cleanup_savings = savings('final_cleanup_cost_billion_usd')
+        damage_savings = savings('final_environmental_damage_cost_billion_usd')
+        total_savings = savings('total_economic_cost_billion_usd')
+        plastic_reduction = savings('total_plastic_accumulated_tonnes')
+        gdp_reduction = savings('max_gdp_impact_percent')
+        
+        for i, scenario_name in enumerate(names):
             comparison['coverage_reduction'][scenario_name] = {
-                'earth_coverage_reduction_pp': baseline['final_earth_coverage_percent'] - summary['final_earth_coverage_percent'],
-                'ocean_coverage_reduction_pp': baseline['final_ocean_coverage_percent'] - summary['final_ocean_coverage_percent'],
-                'delayed_critical_coverage_years': (summary['critical_coverage_year'] or 999) - (baseline['critical_coverage_year'] or 999)
+                'earth_coverage_reduction_pp': earth_reduction[i],
+                'ocean_coverage_reduction_pp': ocean_reduction[i],
+                'delayed_critical_coverage_years': delayed_years[i]
             }
             
             comparison['cost_savings'][scenario_name] = {
-                'cleanup_cost_savings_billion': baseline['final_cleanup_cost_billion_usd'] - summary['final_cleanup_cost_billion_usd'],
-                'environmental_damage_savings_billion': baseline['final_environmental_damage_cost_billion_usd'] - summary['final_environmental_damage_cost_billion_usd'],
-                'total_savings_billion': baseline['total_economic_cost_billion_usd'] - summary['total_economic_cost_billion_usd']
+                'cleanup_cost_savings_billion': cleanup_savings[i],
+                'environmental_damage_savings_billion': damage_savings[i],
+                'total_savings_billion': total_savings[i]
             }
             
             comparison['environmental_benefits'][scenario_name] = {
-                'plastic_reduction_tonnes': baseline['total_plastic_accumulated_tonnes'] - summary['total_plastic_accumulated_tonnes'],
-                'gdp_impact_reduction_pp': baseline['max_gdp_impact_percent'] - summary['max_gdp_impact_percent']
+                'plastic_reduction_tonnes': plastic_reduction[i],
+                'gdp_impact_reduction_pp': gdp_reduction[i]
             }
         
         # Generate insights
@@ -6,6 +6,8 @@ Common utilities for mathematical operations, formatting, and data processing.
 
 from .math_utils import (
     moving_average,
+    OnlineMovingAverage,
+    persistence_powers,
     exponential_decay,
     compound_growth,
     calculate_statistics,
@@ -27,6 +29,8 @@ from .formatters import (
 __all__ = [
     # Math utilities
     'moving_average',
+    'OnlineMovingAverage',
+    'persistence_powers',
     'exponential_decay',
     'compound_growth',
     'calculate_statistics',
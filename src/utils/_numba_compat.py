@@ -0,0 +1,25 @@
+"""
+Numba Compatibility
+
+Numba is an optional dependency. The compiled kernels in utils and models
+import ``njit``, ``prange`` and ``NUMBA_AVAILABLE`` from here; without numba,
+``njit`` leaves functions uncompiled and ``prange`` is ``range``, so the
+kernels still run as plain Python.
+
+Kernels are compiled lazily and never cached on disk: the packages are
+imported both as ``utils.``/``models.`` and ``src.utils.``/``src.models.``,
+and numba cannot load a cache written under the other name.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # Optional dependency
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Stand-in for ``numba.njit`` that leaves the function uncompiled."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -0,0 +1,72 @@
+"""
+Compiled Window Kernels
+
+Numba-compiled kernels for rolling-window calculations. Numba is optional;
+when it is not installed ``NUMBA_AVAILABLE`` is False and callers fall back
+to their vectorized NumPy implementations.
+"""
+
+import numpy as np
+
+from ._numba_compat import NUMBA_AVAILABLE, njit, prange
+
+# Number of contiguous tiles processed concurrently by rolling_mean_parallel
+PARALLEL_TILES = 64
+
+
+@njit
+def rolling_mean(arr: np.ndarray, window: int, out: np.ndarray) -> None:
+    """
+    Trailing moving average with a single running sum.
+    
+    The first ``window - 1`` outputs average the values seen so far.
+    
+    Args:
+        arr: Input series (float64)
+        window: Window size (positive)
+        out: Output buffer, same length as ``arr``
+    """
+    n = arr.shape[0]
+    running_sum = 0.0
+    for i in range(min(window, n)):
+        running_sum += arr[i]
+        out[i] = running_sum / (i + 1)
+    for i in range(window, n):
+        running_sum += arr[i] - arr[i - window]
+        out[i] = running_sum / window
+
+
+@njit
+def _rolling_mean_tile(arr: np.ndarray, window: int, out: np.ndarray, start: int, end: int) -> None:
+    """Fill ``out[start:end]``, seeding the running sum from the preceding values."""
+    first = max(0, start - window + 1)
+    running_sum = 0.0
+    for j in range(first, start):
+        running_sum += arr[j]
+    for i in range(start, end):
+        running_sum += arr[i]
+        if i - window >= first:
+            running_sum -= arr[i - window]
+        out[i] = running_sum / min(i + 1, window)
+
+
+@njit(parallel=True)
+def rolling_mean_parallel(arr: np.ndarray, window: int, out: np.ndarray) -> None:
+    """
+    Tiled, multi-threaded variant of ``rolling_mean``.
+    
+    The series is split into contiguous tiles; each tile seeds its running
+    sum from the ``window - 1`` values preceding it and is then scanned
+    independently, so tiles need no coordination.
+    
+    Args:
+        arr: Input series (float64)
+        window: Window size (positive)
+        out: Output buffer, same length as ``arr``
+    """
+    n = arr.shape[0]
+    tile_size = (n + PARALLEL_TILES - 1) // PARALLEL_TILES
+    for tile in prange(PARALLEL_TILES):
+        start = min(tile * tile_size, n)
+        end = min(start + tile_size, n)
+        _rolling_mean_tile(arr, window, out, start, end)
@@ -4,9 +4,23 @@ Formatting Utilities
 Functions for formatting economic data and simulation results for display.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import AbstractSet, Dict, Any, List, Mapping, Optional
+import csv
+import io
 import json
+import math
 from datetime import datetime
+from enum import Enum
+from itertools import islice, zip_longest
+
+try:
+    import orjson
+except ImportError:  # Optional dependency; fall back to the stdlib encoder
+    orjson = None
+
+
+# (divisor, suffix) for each power-of-1000 step used by format_currency
+_CURRENCY_SCALES = ((1.0, ''), (1e3, 'K'), (1e6, 'M'), (1e9, 'B'))
 
 
 def format_percentage(value: float, decimals: int = 2) -> str:
@@ -44,15 +58,15 @@ def format_currency(value: float, currency: str = "USD", decimals: int = 2) -> s
     else:
         symbol = currency + " "
     
-    # Handle large numbers
-    if abs(value) >= 1_000_000_000:
-        return f"{symbol}{value/1_000_000_000:.{decimals}f}B"
-    elif abs(value) >= 1_000_000:
-        return f"{symbol}{value/1_000_000:.{decimals}f}M"
-    elif abs(value) >= 1_000:
-        return f"{symbol}{value/1_000:.{decimals}f}K"
-    else:
-        return f"{symbol}{value:.{decimals}f}"
+    # Handle large numbers: pick the K/M/B scale from the decimal exponent
+    magnitude = abs(value)
+    scale = 0
+    if magnitude >= 1_000:
+        scale = 3 if math.isinf(magnitude) else min(int(math.log10(magnitude)) // 3, 3)
+        if magnitude < _CURRENCY_SCALES[scale][0]:
+            scale -= 1  # log10 rounded up just below a power of 1000
+    divisor, suffix = _CURRENCY_SCALES[scale]
+    return f"{symbol}{value/divisor:.{decimals}f}{suffix}"
 
 
 def format_number(value: float, decimals: int = 2, thousands_sep: str = ",") -> str:
@@ -152,10 +166,6 @@ def format_time_series(data: Dict[str, List], title: str = "Time Series Data") -
     if not data:
         return "No data to display"
     
-    lines = []
-    lines.append(f"\n{title}")
-    lines.append("=" * len(title))
-    
     # Get periods (assuming it's the first key or 'periods')
     periods_key = 'periods' if 'periods' in data else list(data.keys())[0]
     periods = data[periods_key]
@@ -168,37 +178,59 @@ def format_time_series(data: Dict[str, List], title: str = "Time Series Data") -
     data_keys = [key for key in data.keys() if key != periods_key]
     headers.extend(data_keys)
     
+    # Format every cell once; the strings are reused for both width
+    # measurement and output. Series are homogeneous, so the cell
+    # formatter is chosen once per column from its first value.
+    n_periods = len(periods)
+    columns = [list(map(str, periods))]
+    for key in data_keys:
+        values = data[key][:n_periods]
+        to_str = "{:.4f}".format if len(values) and isinstance(values[0], float) else str
+        column = list(map(to_str, values))
+        column.extend(["N/A"] * (n_periods - len(column)))
+        columns.append(column)
+    
     # Calculate column widths
-    col_widths = [max(len(str(header)), 8) for header in headers]
-    for i, period in enumerate(periods):
-        col_widths[0] = max(col_widths[0], len(str(period)))
-        for j, key in enumerate(data_keys, 1):
-            if i < len(data[key]):
-                value_str = f"{data[key][i]:.4f}" if isinstance(data[key][i], float) else str(data[key][i])
-                col_widths[j] = max(col_widths[j], len(value_str))
-    
-    # Create header row
-    header_row = " | ".join(header.ljust(col_widths[i]) for i, header in enumerate(headers))
-    lines.append(header_row)
-    lines.append("-" * len(header_row))
-    
-    # Create data rows
-    for i, period in enumerate(periods):
-        row_data = [str(period).ljust(col_widths[0])]
-        for j, key in enumerate(data_keys, 1):
-            if i < len(data[key]):
-                value = data[key][i]
-                if isinstance(value, float):
-                    value_str = f"{value:.4f}"
-                else:
-                    value_str = str(value)
-                row_data.append(value_str.ljust(col_widths[j]))
-            else:
-                row_data.append("N/A".ljust(col_widths[j]))
-        
-        lines.append(" | ".join(row_data))
+    col_widths = [
+        max(max(len(str(header)), 8), max(len(cell) for cell in column))
+        for header, column in zip(headers, columns)
+    ]
+    row_template = " | ".join("{:<" + str(width) + "}" for width in col_widths)
     
-    return "\n".join(lines)
+    # Title and header row
+    out = io.StringIO()
+    header_row = row_template.format(*headers)
+    out.write(f"\n{title}\n{'=' * len(title)}\n{header_row}\n{'-' * len(header_row)}")
+    
+    # Data rows
+    for row in zip(*columns):
+        out.write("\n")
+        out.write(row_template.format(*row))
+    
+    return out.getvalue()
+
+
+def _orjson_matches_json(value: Any) -> bool:
+    """
+    Check that orjson encodes a value as ``json.dump(..., default=str)`` does.
+    
+    orjson writes NaN and infinity as null, encodes enums by value and only
+    accepts a few key types, so such data is left to the stdlib encoder.
+    """
+    if isinstance(value, float):
+        return math.isfinite(value)
+    if isinstance(value, dict):
+        return (all(key is None or isinstance(key, (str, int)) for key in value)
+                and all(map(_orjson_matches_json, value.values())))
+    if isinstance(value, (list, tuple)):
+        return all(map(_orjson_matches_json, value))
+    return not isinstance(value, Enum)
+
+
+def _orjson_default(value: Any) -> Any:
+    """Encode values orjson has no type for as ``json.dump(..., default=str)`` does."""
+    # json writes float subclasses such as numpy.float64 as numbers
+    return float(value) if isinstance(value, float) else str(value)
 
 
 def export_results_json(results: Dict[str, Any], filename: str, pretty: bool = True) -> None:
@@ -210,6 +242,23 @@ def export_results_json(results: Dict[str, Any], filename: str, pretty: bool = T
         filename: Output filename
         pretty: Whether to format JSON for readability
     """
+    if orjson is not None and _orjson_matches_json(results):
+        # Datetimes, dataclasses and numpy values go through _orjson_default
+        # instead of orjson's own encoders, matching the json.dump output
+        option = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                  | orjson.OPT_PASSTHROUGH_DATACLASS)
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            data = orjson.dumps(results, default=_orjson_default, option=option)
+        except orjson.JSONEncodeError:
+            # Integers wider than 64 bits; json.dump writes them exactly
+            data = None
+        if data is not None:
+            with open(filename, 'wb') as f:
+                f.write(data)
+            return
+    
     with open(filename, 'w') as f:
         if pretty:
             json.dump(results, f, indent=2, default=str)
@@ -224,27 +273,30 @@ def create_csv_export(data: Dict[str, List], filename: str) -> None:
     Args:
         data: Dictionary with time series data
         filename: Output filename
+    
+    Raises:
+        TypeError: If a value of ``data`` is not a sequence, e.g. a summary dict
     """
     if not data:
         return
     
+    # zip_longest would silently take a dict's keys or a string's characters
+    for key, values in data.items():
+        if isinstance(values, (str, bytes, Mapping, AbstractSet)) or not hasattr(values, '__len__'):
+            raise TypeError(f"CSV column {key!r} must be a sequence, not {type(values).__name__}")
+    
     # Get periods and data keys
     periods_key = 'periods' if 'periods' in data else list(data.keys())[0]
     periods = data[periods_key]
     data_keys = [key for key in data.keys() if key != periods_key]
     
-    with open(filename, 'w') as f:
-        # Write header
-        headers = ['period'] + data_keys
-        f.write(','.join(headers) + '\n')
-        
-        # Write data rows
-        for i, period in enumerate(periods):
-            row = [str(period)]
-            for key in data_keys:
-                if i < len(data[key]):
-                    value = data[key][i]
-                    row.append(str(value))
-                else:
-                    row.append('')
-            f.write(','.join(row) + '\n') 
\ No newline at end of file
+    # Pad short series with blanks and stop at the last period
+    rows = islice(
+        zip_longest(periods, *(data[key] for key in data_keys), fillvalue=''),
+        len(periods)
+    )
+    
+    with open(filename, 'w', newline='', buffering=1 << 20) as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(['period'] + data_keys)
+        writer.writerows(rows)
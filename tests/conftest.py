@@ -0,0 +1,35 @@
+"""
+Shared pytest configuration for the Jinn-Core test suite.
+"""
+
+import logging
+import os
+import sys
+import pytest
+
+# Make the src/ packages (engine, models, utils) importable from every test
+# module; done once here instead of at the top of each test file
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+# Suppress info messages during tests; the models log at INFO on every run.
+# logging.disable rejects INFO and DEBUG calls before any logger or handler
+# is consulted, while warnings and errors still reach pytest's log capture
+logging.disable(logging.INFO)
+
+
+def pytest_configure(config):
+    """Register markers used by the suite."""
+    # Provided by pytest-xdist; registered here so runs without it stay quiet
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run all tests of the group on the same xdist worker"
+    )
+
+
+@pytest.fixture(scope='session')
+def engine():
+    """One SimulationEngine shared by every test that only runs simulations on it."""
+    from engine import SimulationEngine
+    return SimulationEngine()
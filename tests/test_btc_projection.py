@@ -5,40 +5,49 @@ Tests covering the Bitcoin price projection model functionality.
 """
 
 import unittest
-import sys
-import os
 import math
+from dataclasses import FrozenInstanceError
 
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import pytest
 
+# src/ is put on sys.path by tests/conftest.py
 from models.btc_price_projection import BTCPriceProjectionModel, BTCProjectionScenario, simulate_btc_price_projection
 from engine import SimulationEngine
 
+# Labels produced by BTCPriceProjectionModel._assess_risk_factors
+_VALID_RISK_LEVELS = frozenset({'Low', 'Medium', 'High', 'Very High'})
+_VALID_OVERALL_RISK_LEVELS = frozenset({'Low', 'Medium', 'High'})
 
+
+@pytest.mark.xdist_group(name='btc_model')
 class TestBTCPriceProjectionModel(unittest.TestCase):
     """Test cases for the Bitcoin Price Projection Model."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.model = BTCPriceProjectionModel({})
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by the read-only tests below."""
+        cls.model = BTCPriceProjectionModel({})
     
     def test_model_initialization(self):
         """Test model initialization with default parameters."""
         self.assertIsInstance(self.model, BTCPriceProjectionModel)
-        self.assertIn('current_price_usd', self.model.parameters)
-        self.assertIn('target_price_usd', self.model.parameters)
-        self.assertIn('max_years', self.model.parameters)
+        self.assertGreaterEqual(self.model.parameters.keys(), {
+            'current_price_usd',
+            'target_price_usd',
+            'max_years'
+        })
         self.assertEqual(self.model.parameters['current_price_usd'], 70000.0)
         self.assertEqual(self.model.parameters['target_price_usd'], 1000000.0)
         self.assertEqual(self.model.parameters['max_years'], 30)
         
         # Check scenarios are defined
-        self.assertIn('baseline', self.model.scenarios)
-        self.assertIn('institutional_adoption', self.model.scenarios)
-        self.assertIn('fiat_crisis', self.model.scenarios)
-        self.assertIn('regulatory_clarity', self.model.scenarios)
-        self.assertIn('combined_shock', self.model.scenarios)
+        self.assertGreaterEqual(self.model.scenarios.keys(), {
+            'baseline',
+            'institutional_adoption',
+            'fiat_crisis',
+            'regulatory_clarity',
+            'combined_shock'
+        })
     
     def test_model_initialization_custom_params(self):
         """Test model initialization with custom parameters."""
@@ -90,15 +99,16 @@ class TestBTCPriceProjectionModel(unittest.TestCase):
         results = self.model.simulate(simulation_config)
         
         self.assertIsInstance(results, dict)
-        self.assertIn('parameters', results)
-        self.assertIn('scenarios', results)
-        self.assertIn('comparison', results)
-        self.assertIn('summary', results)
+        self.assertGreaterEqual(results.keys(), {
+            'parameters',
+            'scenarios',
+            'comparison',
+            'summary'
+        })
         
         # Check that all scenarios were run
         self.assertEqual(len(results['scenarios']), 5)
-        for scenario_name in simulation_config['scenarios']:
-            self.assertIn(scenario_name, results['scenarios'])
+        self.assertGreaterEqual(results['scenarios'].keys(), set(simulation_config['scenarios']))
     
     def test_simulate_single_scenario(self):
         """Test simulation with a single scenario."""
@@ -117,14 +127,17 @@ class TestBTCPriceProjectionModel(unittest.TestCase):
         
         # Check scenario results structure
         baseline_results = results['scenarios']['baseline']
-        self.assertIn('scenario_name', baseline_results)
-        self.assertIn('description', baseline_results)
-        self.assertIn('annual_growth_rate', baseline_results)
-        self.assertIn('base_projection', baseline_results)
-        self.assertIn('enhanced_projection', baseline_results)
-        self.assertIn('risk_assessment', baseline_results)
+        self.assertGreaterEqual(baseline_results.keys(), {
+            'scenario_name',
+            'description',
+            'annual_growth_rate',
+            'base_projection',
+            'enhanced_projection',
+            'risk_assessment'
+        })
 
 
+@pytest.mark.xdist_group(name='btc_function')
 class TestSimpleBTCProjectionFunction(unittest.TestCase):
     """Test cases for the simple Bitcoin price projection function."""
     
@@ -138,25 +151,27 @@ class TestSimpleBTCProjectionFunction(unittest.TestCase):
         )
         
         self.assertIsInstance(result, dict)
-        self.assertIn('years_to_target', result)
-        self.assertIn('final_price', result)
-        self.assertIn('total_return_multiple', result)
-        self.assertIn('annual_return_needed', result)
-        self.assertIn('price_trajectory', result)
-        self.assertIn('feasibility_assessment', result)
-        self.assertIn('target_achieved_in_timeframe', result)
+        self.assertGreaterEqual(result.keys(), {
+            'years_to_target',
+            'final_price',
+            'total_return_multiple',
+            'annual_return_needed',
+            'price_trajectory',
+            'feasibility_assessment',
+            'target_achieved_in_timeframe'
+        })
         
         # Check calculations
-        expected_years = math.log(1000000 / 70000) / math.log(1.40)
-        self.assertAlmostEqual(result['years_to_target'], expected_years, places=2)
+        expected_years = math.log(1000000 / 70000) / math.log1p(0.40)
+        self.assertTrue(math.isclose(result['years_to_target'], expected_years, abs_tol=0.005))
         
         # Check that final price is calculated correctly
         expected_final_price = 70000 * (1.40 ** 30)
-        self.assertAlmostEqual(result['final_price'], expected_final_price, places=0)
+        self.assertTrue(math.isclose(result['final_price'], expected_final_price, abs_tol=0.5))
         
         # Check return multiple
         expected_multiple = result['final_price'] / 70000
-        self.assertAlmostEqual(result['total_return_multiple'], expected_multiple, places=2)
+        self.assertTrue(math.isclose(result['total_return_multiple'], expected_multiple, abs_tol=0.005))
     
     def test_growth_rate_scaling(self):
         """Test that higher growth rates result in faster target achievement."""
@@ -184,7 +199,7 @@ class TestSimpleBTCProjectionFunction(unittest.TestCase):
         
         self.assertEqual(trajectory[10]['year'], 10)
         expected_price_year_10 = 70000 * (1.40 ** 10)
-        self.assertAlmostEqual(trajectory[10]['price'], expected_price_year_10, places=0)
+        self.assertTrue(math.isclose(trajectory[10]['price'], expected_price_year_10, abs_tol=0.5))
     
     def test_feasibility_assessment(self):
         """Test feasibility assessment logic."""
@@ -215,6 +230,7 @@ class TestSimpleBTCProjectionFunction(unittest.TestCase):
             simulate_btc_price_projection(70000, 50000, 0.40, 30)
 
 
+@pytest.mark.xdist_group(name='btc_dataclass')
 class TestBTCProjectionScenario(unittest.TestCase):
     """Test cases for BTCProjectionScenario dataclass."""
     
@@ -252,15 +268,26 @@ class TestBTCProjectionScenario(unittest.TestCase):
         self.assertEqual(scenario.adoption_curve, "linear")  # Default value
         self.assertEqual(scenario.regulatory_impact, 1.0)  # Default value
         self.assertEqual(scenario.institutional_factor, 1.0)  # Default value
+    
+    def test_default_scenarios_are_frozen(self):
+        """Test that the scenarios shared between models cannot be modified."""
+        first = BTCPriceProjectionModel({})
+        second = BTCPriceProjectionModel({})
+        
+        with self.assertRaises(FrozenInstanceError):
+            first.scenarios['baseline'].annual_growth_rate = 0.0
+        self.assertEqual(second.scenarios['baseline'].annual_growth_rate, 0.40)
 
 
+@pytest.mark.xdist_group(name='btc_integration')
 class TestBTCProjectionIntegration(unittest.TestCase):
     """Integration tests for Bitcoin price projection model."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.engine = SimulationEngine()
-        self.btc_projection_scenario = {
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by the read-only tests below."""
+        cls.engine = SimulationEngine()
+        cls.btc_projection_scenario = {
             'model': 'btc_price_projection',
             'parameters': {
                 'current_price_usd': 70000.0,
@@ -274,34 +301,33 @@ class TestBTCProjectionIntegration(unittest.TestCase):
                 'scenarios': ['baseline', 'institutional_adoption']
             }
         }
+        # Every test below only inspects the results of this one run
+        cls.results = cls.engine.run_simulation(cls.btc_projection_scenario)
     
     def test_model_loads_and_runs(self):
         """Test that the model loads and runs successfully."""
         self.assertIn('btc_price_projection', self.engine.models)
         self.assertEqual(self.engine.models['btc_price_projection'], BTCPriceProjectionModel)
         
-        # Run simulation
-        results = self.engine.run_simulation(self.btc_projection_scenario)
+        results = self.results
         
         # Verify structure
-        self.assertIn('model', results)
-        self.assertIn('scenario', results)
-        self.assertIn('results', results)
-        self.assertIn('metadata', results)
+        self.assertGreaterEqual(results.keys(), {'model', 'scenario', 'results', 'metadata'})
         
         # Verify content
         self.assertEqual(results['model'], 'btc_price_projection')
     
     def test_outputs_match_expected_pattern(self):
         """Test that outputs follow expected patterns."""
-        results = self.engine.run_simulation(self.btc_projection_scenario)
-        simulation_results = results['results']
+        simulation_results = self.results['results']
         
         # Check main structure
-        self.assertIn('parameters', simulation_results)
-        self.assertIn('scenarios', simulation_results)
-        self.assertIn('comparison', simulation_results)
-        self.assertIn('summary', simulation_results)
+        self.assertGreaterEqual(simulation_results.keys(), {
+            'parameters',
+            'scenarios',
+            'comparison',
+            'summary'
+        })
         
         # Check scenario results
         scenarios = simulation_results['scenarios']
@@ -315,13 +341,13 @@ class TestBTCProjectionIntegration(unittest.TestCase):
     
     def test_price_projections_are_positive(self):
         """Test that all price projections are positive and increasing."""
-        results = self.engine.run_simulation(self.btc_projection_scenario)
-        scenarios = results['results']['scenarios']
+        scenarios = self.results['results']['scenarios']
         
         for scenario_name, scenario_data in scenarios.items():
             # Check base projection
             base_proj = scenario_data['base_projection']
-            self.assertGreater(base_proj['final_price'], base_proj['price_trajectory'][0]['price'])
+            first_price = base_proj['price_trajectory'][0]['price']
+            self.assertGreater(base_proj['final_price'], first_price)
             self.assertGreater(base_proj['total_return_multiple'], 1.0)
             
             # Check enhanced projection
@@ -331,45 +357,49 @@ class TestBTCProjectionIntegration(unittest.TestCase):
     
     def test_risk_assessment_present(self):
         """Test that risk assessment is properly calculated."""
-        results = self.engine.run_simulation(self.btc_projection_scenario)
-        scenarios = results['results']['scenarios']
+        scenarios = self.results['results']['scenarios']
         
         for scenario_name, scenario_data in scenarios.items():
             risk_assessment = scenario_data['risk_assessment']
             
             # Check risk categories
-            self.assertIn('time_risk', risk_assessment)
-            self.assertIn('volatility_risk', risk_assessment)
-            self.assertIn('regulatory_risk', risk_assessment)
-            self.assertIn('overall_risk', risk_assessment)
-            self.assertIn('risk_score', risk_assessment)
-            self.assertIn('key_risks', risk_assessment)
+            self.assertGreaterEqual(risk_assessment.keys(), {
+                'time_risk',
+                'volatility_risk',
+                'regulatory_risk',
+                'overall_risk',
+                'risk_score',
+                'key_risks'
+            })
             
             # Check risk levels are valid
-            valid_risk_levels = ['Low', 'Medium', 'High', 'Very High']
-            self.assertIn(risk_assessment['time_risk'], valid_risk_levels)
-            self.assertIn(risk_assessment['volatility_risk'], valid_risk_levels)
-            self.assertIn(risk_assessment['regulatory_risk'], valid_risk_levels)
-            self.assertIn(risk_assessment['overall_risk'], ['Low', 'Medium', 'High'])
+            self.assertIn(risk_assessment['time_risk'], _VALID_RISK_LEVELS)
+            self.assertIn(risk_assessment['volatility_risk'], _VALID_RISK_LEVELS)
+            self.assertIn(risk_assessment['regulatory_risk'], _VALID_RISK_LEVELS)
+            self.assertIn(risk_assessment['overall_risk'], _VALID_OVERALL_RISK_LEVELS)
     
     def test_comparison_and_summary(self):
         """Test that comparison and summary are generated correctly."""
-        results = self.engine.run_simulation(self.btc_projection_scenario)
+        simulation_results = self.results['results']
         
         # Check comparison
-        comparison = results['results']['comparison']
-        self.assertIn('fastest_to_target', comparison)
-        self.assertIn('highest_final_price', comparison)
-        self.assertIn('lowest_risk', comparison)
-        self.assertIn('most_realistic', comparison)
-        self.assertIn('scenario_rankings', comparison)
+        comparison = simulation_results['comparison']
+        self.assertGreaterEqual(comparison.keys(), {
+            'fastest_to_target',
+            'highest_final_price',
+            'lowest_risk',
+            'most_realistic',
+            'scenario_rankings'
+        })
         
         # Check summary
-        summary = results['results']['summary']
-        self.assertIn('target_analysis', summary)
-        self.assertIn('time_to_target', summary)
-        self.assertIn('price_projections', summary)
-        self.assertIn('investment_insights', summary)
+        summary = simulation_results['summary']
+        self.assertGreaterEqual(summary.keys(), {
+            'target_analysis',
+            'time_to_target',
+            'price_projections',
+            'investment_insights'
+        })
         
         # Check target analysis
         target_analysis = summary['target_analysis']
@@ -378,12 +408,14 @@ class TestBTCProjectionIntegration(unittest.TestCase):
         self.assertAlmostEqual(target_analysis['target_multiple'], 1000000 / 70000, places=2)
 
 
+@pytest.mark.xdist_group(name='btc_scenarios')
 class TestBTCProjectionScenarios(unittest.TestCase):
     """Test specific Bitcoin projection scenarios."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.model = BTCPriceProjectionModel({})
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by the read-only tests below."""
+        cls.model = BTCPriceProjectionModel({})
     
     def test_baseline_scenario(self):
         """Test baseline scenario specifically."""
@@ -437,19 +469,14 @@ class TestBTCProjectionScenarios(unittest.TestCase):
         scenarios = results['scenarios']
         
         # Get years to target for each scenario
-        baseline_years = scenarios['baseline']['enhanced_projection']['years_to_target']
-        institutional_years = scenarios['institutional_adoption']['enhanced_projection']['years_to_target']
-        combined_years = scenarios['combined_shock']['enhanced_projection']['years_to_target']
+        years_to_target = {
+            name: scenario['enhanced_projection']['years_to_target']
+            for name, scenario in scenarios.items()
+        }
+        baseline_years = years_to_target['baseline']
+        institutional_years = years_to_target['institutional_adoption']
+        combined_years = years_to_target['combined_shock']
         
         # Combined shock should be fastest, baseline should be slowest
         self.assertLess(combined_years, institutional_years)
         self.assertLess(institutional_years, baseline_years)
-
-
-if __name__ == '__main__':
-    # Set up logging to suppress info messages during tests
-    import logging
-    logging.getLogger().setLevel(logging.WARNING)
-    
-    # Run the tests
-    unittest.main() 
\ No newline at end of file
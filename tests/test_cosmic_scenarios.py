@@ -6,69 +6,60 @@ Demonstrates challenging scenarios where the window for interplanetary expansion
 becomes critical or impossible.
 """
 
-import json
-from src.models.cosmic_consciousness_timing import simulate_cosmic_consciousness_timing, CosmicConsciousnessTimingModel
+import itertools
+import numpy as np
+from src.models import cosmic_consciousness_timing
+from src.models.cosmic_consciousness_timing import (
+    simulate_cosmic_consciousness_timing,
+    simulate_cosmic_consciousness_timing_batch,
+    CosmicConsciousnessTimingModel
+)
+from src.utils.formatters import export_results_json
 
 def test_challenging_scenarios():
     """Test scenarios where civilizations face extinction pressure."""
     print("🔥 CHALLENGING COSMIC SCENARIOS")
     print("=" * 60)
     
-    scenarios = [
-        {
-            'name': 'Scenario 1: Tight Window',
-            'description': 'Civilization needs 0.4B years, has 0.5B years left',
-            'evolution_duration': 4.0,
-            'time_left': 0.5,
-            'window_needed': 0.4,
-            'risk_tolerance': 0.1
-        },
-        {
-            'name': 'Scenario 2: Very Tight Window',
-            'description': 'Civilization needs 0.45B years, has 0.5B years left',
-            'evolution_duration': 4.0,
-            'time_left': 0.5,
-            'window_needed': 0.45,
-            'risk_tolerance': 0.1
-        },
-        {
-            'name': 'Scenario 3: Impossible Window',
-            'description': 'Civilization needs 0.6B years, has 0.5B years left',
-            'evolution_duration': 4.0,
-            'time_left': 0.5,
-            'window_needed': 0.6,
-            'risk_tolerance': 0.1
-        },
-        {
-            'name': 'Scenario 4: Shorter Planetary Lifespan',
-            'description': 'Planet becomes uninhabitable in 0.3B years',
-            'evolution_duration': 4.0,
-            'time_left': 0.3,
-            'window_needed': 0.2,
-            'risk_tolerance': 0.1
-        },
-        {
-            'name': 'Scenario 5: High-Risk Civilization',
-            'description': 'Conservative species needs 50% safety margin',
-            'evolution_duration': 4.0,
-            'time_left': 0.5,
-            'window_needed': 0.2,
-            'risk_tolerance': 0.5
-        }
+    # One column per scenario field
+    names = [
+        'Scenario 1: Tight Window',
+        'Scenario 2: Very Tight Window',
+        'Scenario 3: Impossible Window',
+        'Scenario 4: Shorter Planetary Lifespan',
+        'Scenario 5: High-Risk Civilization'
+    ]
+    descriptions = [
+        'Civilization needs 0.4B years, has 0.5B years left',
+        'Civilization needs 0.45B years, has 0.5B years left',
+        'Civilization needs 0.6B years, has 0.5B years left',
+        'Planet becomes uninhabitable in 0.3B years',
+        'Conservative species needs 50% safety margin'
+    ]
+    evolution_duration = np.array([4.0, 4.0, 4.0, 4.0, 4.0])
+    time_left = np.array([0.5, 0.5, 0.5, 0.3, 0.5])
+    window_needed = np.array([0.4, 0.45, 0.6, 0.2, 0.2])
+    risk_tolerance = np.array([0.1, 0.1, 0.1, 0.1, 0.5])
+    
+    batch = simulate_cosmic_consciousness_timing_batch(
+        evolution_duration=evolution_duration,
+        time_left=time_left,
+        window_needed=window_needed,
+        risk_tolerance=risk_tolerance
+    )
+    
+    # Back to one dict per scenario for display and JSON export
+    columns = {key: values.tolist() for key, values in batch.items()}
+    columns['window_needed'] = window_needed.tolist()
+    columns['risk_tolerance'] = risk_tolerance.tolist()
+    results = [
+        dict(zip(columns, row), scenario_name=name)
+        for row, name in zip(zip(*columns.values()), names)
     ]
     
-    results = []
-    
-    for scenario in scenarios:
-        print(f"\n📊 {scenario['name']}")
-        print(f"   {scenario['description']}")
-        
-        result = simulate_cosmic_consciousness_timing(
-            evolution_duration=scenario['evolution_duration'],
-            time_left=scenario['time_left'],
-            window_needed=scenario['window_needed'],
-            risk_tolerance=scenario['risk_tolerance']
-        )
+    for result, description in zip(results, descriptions):
+        print(f"\n📊 {result['scenario_name']}")
+        print(f"   {description}")
         
         status = "✅ SUCCESS" if result['civilization_succeeds'] else "❌ FAILURE"
         print(f"   Result: {status}")
@@ -76,9 +67,6 @@ def test_challenging_scenarios():
         print(f"   Minimum Needed: {result['minimum_time_needed']:.2f}B years")
         print(f"   Safety Margin: {result['safety_margin']:.2f}B years")
         print(f"   Expansion Probability: {result['expansion_probability']:.1%}")
-        
-        result['scenario_name'] = scenario['name']
-        results.append(result)
     
     # Summary
     success_count = sum(1 for r in results if r['civilization_succeeds'])
@@ -106,32 +94,33 @@ def test_evolution_delay_thresholds():
     print(f"- Risk Tolerance: {risk_tolerance:.0%}")
     print(f"\nTesting Evolution Delays:")
     
-    critical_delay = None
-    results = []
-    
-    for delay_factor in delay_factors:
-        evolution_duration = base_evolution * (1 + delay_factor)
-        
-        result = simulate_cosmic_consciousness_timing(
-            evolution_duration=evolution_duration,
-            time_left=time_left,
-            window_needed=window_needed,
-            risk_tolerance=risk_tolerance
-        )
-        
-        status = "✅" if result['civilization_succeeds'] else "❌"
-        print(f"  +{delay_factor:>4.0%} delay ({evolution_duration:.1f}B years): {status} "
-              f"(Prob: {result['expansion_probability']:>5.1%})")
-        
-        if not result['civilization_succeeds'] and critical_delay is None:
-            critical_delay = delay_factor
-        
-        results.append({
+    # Evaluate the whole sweep in one call
+    batch = simulate_cosmic_consciousness_timing_batch(
+        evolution_duration=base_evolution * (1 + np.array(delay_factors)),
+        time_left=time_left,
+        window_needed=window_needed,
+        risk_tolerance=risk_tolerance
+    )
+    succeeds = batch['civilization_succeeds']
+    critical_delay = delay_factors[np.argmax(~succeeds)] if not succeeds.all() else None
+    
+    results = [
+        {
             'delay_factor': delay_factor,
             'evolution_duration': evolution_duration,
-            'succeeds': result['civilization_succeeds'],
-            'expansion_probability': result['expansion_probability']
-        })
+            'succeeds': succeeded,
+            'expansion_probability': expansion_probability
+        }
+        for delay_factor, evolution_duration, succeeded, expansion_probability in zip(
+            delay_factors, batch['evolution_duration'].tolist(),
+            succeeds.tolist(), batch['expansion_probability'].tolist()
+        )
+    ]
+    
+    for result in results:
+        status = "✅" if result['succeeds'] else "❌"
+        print(f"  +{result['delay_factor']:>4.0%} delay ({result['evolution_duration']:.1f}B years): {status} "
+              f"(Prob: {result['expansion_probability']:>5.1%})")
     
     if critical_delay is not None:
         print(f"\n🚨 Critical Evolution Delay: +{critical_delay:.0%}")
@@ -197,6 +186,39 @@ def test_model_with_challenging_parameters():
     
     return results
 
+def test_batch_paths_match_scalar_function(monkeypatch):
+    """Test the NumPy and compiled batch paths against the scalar function."""
+    # No time left, a short and a long window; starting levels on every
+    # Kardashev step (zero growth keeps the average level on the step)
+    grid = list(itertools.product(
+        [-0.5, 0.0, 0.05, 0.3, 1.0, 4.0],          # time_left
+        [0.05, 0.2, 1.0],                           # window_needed
+        [0.0, 0.1, 0.5],                            # risk_tolerance
+        [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.2],   # starting_kardashev_level
+        [0.0, 0.1, 1.0]                             # kardashev_growth_rate
+    ))
+    columns = np.array(grid).T
+    keys = ('minimum_time_needed', 'civilization_succeeds', 'expansion_probability',
+            'safety_margin', 'final_kardashev_level')
+    
+    for kardashev_enabled in (True, False):
+        expected = [
+            simulate_cosmic_consciousness_timing(4.0, *row, kardashev_enabled=kardashev_enabled)
+            for row in grid
+        ]
+        # Above the threshold the NumPy form runs; at zero, the kernel
+        for min_scenarios in (len(grid) + 1, 0):
+            monkeypatch.setattr(cosmic_consciousness_timing, '_NUMBA_MIN_SCENARIOS', min_scenarios)
+            batch = simulate_cosmic_consciousness_timing_batch(
+                4.0, *columns, kardashev_enabled=kardashev_enabled
+            )
+            for key in keys:
+                np.testing.assert_array_equal(
+                    batch[key], [result[key] for result in expected],
+                    err_msg=f"{key} (kardashev_enabled={kardashev_enabled}, "
+                            f"min_scenarios={min_scenarios})"
+                )
+
 def main():
     """Run all challenging scenario tests."""
     print("🚀 Cosmic Consciousness Timing - Challenging Scenarios")
@@ -215,8 +237,8 @@ def main():
         'challenging_model_summary': model_results['summary']
     }
     
-    with open('challenging_cosmic_scenarios.json', 'w') as f:
-        json.dump(output, f, indent=2)
+    # Uses orjson when the perf extra is installed
+    export_results_json(output, 'challenging_cosmic_scenarios.json')
     
     print("\n" + "=" * 60)
     print("✅ Challenging Scenarios Testing Complete!")
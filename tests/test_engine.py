@@ -8,6 +8,9 @@ import unittest
 import sys
 import os
 import json
+import tempfile
+import numpy as np
+from dataclasses import FrozenInstanceError
 from unittest.mock import patch, mock_open
 
 # Add src directory to path for imports
@@ -22,13 +25,26 @@ from models.global_conflict import GlobalConflictModel, GlobalConflictShock, sim
 from models.earth_rotation_shock import EarthRotationShockModel, EarthRotationShock, simulate_earth_rotation_shock
 from models.btc_price_projection import BTCPriceProjectionModel, BTCProjectionScenario, simulate_btc_price_projection
 
+# Scenario written once to the file read by TestSimulationEngine.test_load_scenario
+SCENARIO_DICT = {"model": "interest_rate", "test": True}
+SCENARIO_JSON = json.dumps(SCENARIO_DICT).encode()
+
 
 class TestSimulationEngine(unittest.TestCase):
     """Test cases for the main simulation engine."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.engine = SimulationEngine()
+    @classmethod
+    def setUpClass(cls):
+        """Set up the engine and scenario file shared by the tests below; none of them modify it."""
+        cls.engine = SimulationEngine()
+        cls._scenario_file = tempfile.NamedTemporaryFile(suffix='.json', delete=False)
+        cls._scenario_file.write(SCENARIO_JSON)
+        cls._scenario_file.close()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared scenario file."""
+        os.unlink(cls._scenario_file.name)
     
     def test_engine_initialization(self):
         """Test that the engine initializes correctly."""
@@ -59,14 +75,40 @@ class TestSimulationEngine(unittest.TestCase):
         self.assertIn('earth_rotation_shock', self.engine.models)
         self.assertIn('btc_price_projection', self.engine.models)
     
-    @patch('builtins.open', new_callable=mock_open, read_data='{"model": "interest_rate", "test": true}')
-    def test_load_scenario(self, mock_file):
+    def test_load_scenario(self):
         """Test scenario loading from JSON file."""
-        scenario = self.engine.load_scenario('test_scenario.json')
+        scenario = self.engine.load_scenario(self._scenario_file.name)
         self.assertIsInstance(scenario, dict)
-        self.assertEqual(scenario['model'], 'interest_rate')
-        self.assertTrue(scenario['test'])
-        mock_file.assert_called_once_with('test_scenario.json', 'r')
+        self.assertEqual(scenario, SCENARIO_DICT)
+    
+    def test_load_scenario_reuses_unchanged_file(self):
+        """Test that repeated loads return independent dicts and pick up edits."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            scenario_path = os.path.join(tmp_dir, 'scenario.json')
+            with open(scenario_path, 'w') as f:
+                json.dump({'model': 'interest_rate', 'parameters': {}}, f)
+            
+            first = self.engine.load_scenario(scenario_path)
+            first['parameters']['periods'] = 5
+            second = self.engine.load_scenario(scenario_path)
+            self.assertEqual(second['parameters'], {})
+            
+            with open(scenario_path, 'w') as f:
+                json.dump({'model': 'inflation_shock', 'parameters': {}}, f)
+            
+            self.assertEqual(self.engine.load_scenario(scenario_path)['model'], 'inflation_shock')
+    
+    def test_load_scenario_nan_and_wide_integers(self):
+        """Test that loading accepts NaN and keeps integers wider than 64 bits exact."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            scenario_path = os.path.join(tmp_dir, 'scenario.json')
+            with open(scenario_path, 'w') as f:
+                f.write('{"model": "interest_rate", "parameters": '
+                        '{"policy_rate": NaN, "initial_gdp": 123456789012345678901234567890}}')
+            
+            parameters = self.engine.load_scenario(scenario_path)['parameters']
+            self.assertTrue(np.isnan(parameters['policy_rate']))
+            self.assertEqual(parameters['initial_gdp'], 123456789012345678901234567890)
     
     def test_load_scenario_file_not_found(self):
         """Test handling of missing scenario file."""
@@ -129,14 +171,49 @@ class TestSimulationEngine(unittest.TestCase):
             self.engine.run_simulation(scenario)
         
         self.assertIn('Unknown model: unknown_model', str(context.exception))
+    
+    def test_run_simulation_with_cache(self):
+        """Test that cached runs return independent copies of the first run's results."""
+        # Own engine: the cache is engine state the shared one must not carry
+        engine = SimulationEngine()
+        scenario = {
+            'model': 'interest_rate',
+            'parameters': {'periods': 6},
+            'simulation': {'shock': {'magnitude': 0.01, 'duration': 2}}
+        }
+        
+        first = engine.run_simulation(scenario, use_cache=True)
+        first['results']['gdp_growth'][0] = 0.0
+        second = engine.run_simulation(scenario, use_cache=True)
+        uncached = engine.run_simulation(scenario)
+        
+        self.assertNotIn('cached', first['metadata'])
+        self.assertTrue(second['metadata']['cached'])
+        self.assertNotIn('cached', uncached['metadata'])
+        self.assertEqual(second['results'], uncached['results'])
+    
+    def test_run_simulation_parallel(self):
+        """Test that scenarios run in worker processes match in-process runs."""
+        scenarios = [
+            {'model': 'interest_rate', 'parameters': {'periods': 6},
+             'simulation': {'shock': {'magnitude': magnitude, 'duration': 2}}}
+            for magnitude in (0.0, 0.005, 0.01)
+        ]
+        
+        results = self.engine.run_simulation_parallel(scenarios, max_workers=2)
+        
+        self.assertEqual([result['model'] for result in results], ['interest_rate'] * 3)
+        for scenario, result in zip(scenarios, results):
+            self.assertEqual(result['results'], self.engine.run_simulation(scenario)['results'])
 
 
 class TestInterestRateModel(unittest.TestCase):
     """Test cases for the Interest Rate Model."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.model = InterestRateModel({})
+    @classmethod
+    def setUpClass(cls):
+        """Set up the model shared by the tests below; none of them modify it."""
+        cls.model = InterestRateModel({})
     
     def test_model_initialization(self):
         """Test model initialization with default parameters."""
@@ -183,8 +260,7 @@ class TestInterestRateModel(unittest.TestCase):
         # Check that baseline values are maintained
         gdp_values = results['gdp_growth']
         expected_baseline = self.model.parameters['baseline_gdp_growth']
-        for value in gdp_values:
-            self.assertAlmostEqual(value, expected_baseline, places=6)
+        np.testing.assert_allclose(gdp_values, expected_baseline, rtol=0, atol=5e-7)
     
     def test_simulate_with_shock(self):
         """Test simulation with interest rate shock."""
@@ -223,17 +299,35 @@ class TestInterestRateModel(unittest.TestCase):
         results = self.model.simulate(simulation_config)
         shock_values = results['interest_rate_shock']
         
-        # First period should have full shock
-        self.assertAlmostEqual(shock_values[0], 0.01, places=6)
-        
-        # Second period should be smaller due to persistence
+        # Full shock in the first period, shrinking by the persistence factor
+        # each period after, and none once the shock has ended
         persistence = self.model.parameters['persistence']
-        expected_second = 0.01 * persistence
-        self.assertAlmostEqual(shock_values[1], expected_second, places=6)
+        expected = [0.01, 0.01 * persistence, 0.01 * (persistence ** 2), 0.0]
+        np.testing.assert_allclose(shock_values[:4], expected, rtol=0, atol=5e-7)
+    
+    def test_repeated_simulations_start_from_baseline(self):
+        """Test that a shocked run leaves no trace in the next run of the same model."""
+        shocked = self.model.simulate({'shock': {'magnitude': 0.01, 'duration': 5}})
+        unshocked = self.model.simulate({})
+        
+        self.assertLess(shocked['gdp_growth'][0], self.model.parameters['baseline_gdp_growth'])
+        self.assertEqual(unshocked['interest_rate_shock'], [0.0] * self.model.parameters['periods'])
+        self.assertEqual(set(unshocked['gdp_growth']), {self.model.parameters['baseline_gdp_growth']})
+    
+    def test_simulate_batch_matches_simulate(self):
+        """Test that a batch of scenarios gives the same results as running each alone."""
+        parameters = [{}, {'periods': 8}, {'periods': 8}]
+        simulation_configs = [
+            {'shock': {'magnitude': 0.01, 'duration': 3, 'start_period': 2}},
+            {'shock': {'magnitude': -0.01, 'duration': 10}},
+            {},
+        ]
+        
+        batch_results = InterestRateModel.simulate_batch([dict(params) for params in parameters], simulation_configs)
         
-        # Third period should be even smaller
-        expected_third = 0.01 * (persistence ** 2)
-        self.assertAlmostEqual(shock_values[2], expected_third, places=6)
+        self.assertEqual(len(batch_results), len(simulation_configs))
+        for params, config, batch_result in zip(parameters, simulation_configs, batch_results):
+            self.assertEqual(batch_result, InterestRateModel(dict(params)).simulate(config))
     
     def test_summary_statistics(self):
         """Test that summary statistics are calculated correctly."""
@@ -263,9 +357,10 @@ class TestInterestRateModel(unittest.TestCase):
 class TestInflationShockModel(unittest.TestCase):
     """Test cases for the Inflation Shock Model."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.model = InflationShockModel({})
+    @classmethod
+    def setUpClass(cls):
+        """Set up the model shared by the tests below; none of them modify it."""
+        cls.model = InflationShockModel({})
     
     def test_model_initialization(self):
         """Test model initialization with default parameters."""
@@ -312,8 +407,7 @@ class TestInflationShockModel(unittest.TestCase):
         # Check that baseline values are maintained
         inflation_values = results['inflation_rate']
         expected_baseline = self.model.parameters['baseline_inflation']
-        for value in inflation_values:
-            self.assertAlmostEqual(value, expected_baseline, places=6)
+        np.testing.assert_allclose(inflation_values, expected_baseline, rtol=0, atol=5e-7)
     
     def test_simulate_with_shock(self):
         """Test simulation with inflation shock."""
@@ -353,17 +447,35 @@ class TestInflationShockModel(unittest.TestCase):
         results = self.model.simulate(simulation_config)
         shock_values = results['inflation_shock']
         
-        # First period should have full shock
-        self.assertAlmostEqual(shock_values[0], 4.0, places=6)
-        
-        # Second period should be smaller due to persistence
+        # Full shock in the first period, shrinking by the persistence factor
+        # each period after, and none once the shock has ended
         persistence = self.model.parameters['shock_persistence']
-        expected_second = 4.0 * persistence
-        self.assertAlmostEqual(shock_values[1], expected_second, places=6)
+        expected = [4.0, 4.0 * persistence, 4.0 * (persistence ** 2), 0.0]
+        np.testing.assert_allclose(shock_values[:4], expected, rtol=0, atol=5e-7)
+    
+    def test_repeated_simulations_start_from_baseline(self):
+        """Test that a shocked run leaves no trace in the next run of the same model."""
+        shocked = self.model.simulate({'shock': {'spike_magnitude': 4.0, 'duration': 5}})
+        unshocked = self.model.simulate({'shock': {'duration': 0}})
+        
+        self.assertLess(shocked['real_gdp'][0], self.model.parameters['baseline_gdp'])
+        self.assertEqual(unshocked['inflation_shock'], [0.0] * self.model.parameters['periods'])
+        self.assertEqual(set(unshocked['real_gdp']), {self.model.parameters['baseline_gdp']})
+    
+    def test_simulate_batch_matches_simulate(self):
+        """Test that a batch of scenarios gives the same results as running each alone."""
+        parameters = [{}, {'periods': 8}, {'periods': 8}]
+        simulation_configs = [
+            {'shock': {'spike_magnitude': 4.0, 'duration': 3, 'start_period': 2}},
+            {'shock': {'spike_magnitude': -4.0, 'duration': 10}},
+            {},
+        ]
+        
+        batch_results = InflationShockModel.simulate_batch([dict(params) for params in parameters], simulation_configs)
         
-        # Third period should be even smaller
-        expected_third = 4.0 * (persistence ** 2)
-        self.assertAlmostEqual(shock_values[2], expected_third, places=6)
+        self.assertEqual(len(batch_results), len(simulation_configs))
+        for params, config, batch_result in zip(parameters, simulation_configs, batch_results):
+            self.assertEqual(batch_result, InflationShockModel(dict(params)).simulate(config))
     
     def test_summary_statistics(self):
         """Test that summary statistics are calculated correctly."""
@@ -425,6 +537,20 @@ class TestSimpleInflationFunction(unittest.TestCase):
         
         # Should be capped at 20%
         self.assertEqual(result['expected_investment_drop'], 20.0)
+        self.assertIs(type(result['expected_investment_drop']), float)
+    
+    def test_array_of_spikes(self):
+        """Test that a sweep over inflation spikes runs as one call on an array."""
+        spikes = [0.5, 3.0, 10.0, 15.0]
+        result = simulate_inflation_shock(
+            current_inflation=2.0,
+            inflation_spike=np.array(spikes),
+            gdp=1000000.0,
+            investment_level=200000.0
+        )
+        
+        self.assertEqual(result['new_inflation'].tolist(), [2.0 + spike for spike in spikes])
+        self.assertEqual(result['expected_investment_drop'].tolist(), [1.0, 6.0, 20.0, 20.0])
 
 
 class TestInterestRateShock(unittest.TestCase):
@@ -445,6 +571,15 @@ class TestInterestRateShock(unittest.TestCase):
         self.assertEqual(shock.magnitude, 0.01)
         self.assertEqual(shock.duration, 6)
         self.assertEqual(shock.start_period, 3)
+    
+    def test_shock_is_immutable_and_hashable(self):
+        """Test that shocks are frozen and usable as dictionary keys."""
+        shock = InterestRateShock(magnitude=0.01, duration=6, start_period=3)
+        
+        with self.assertRaises(FrozenInstanceError):
+            shock.magnitude = 0.0
+        self.assertEqual(hash(shock), hash(InterestRateShock(magnitude=0.01, duration=6, start_period=3)))
+        self.assertNotEqual(shock, InterestRateShock(magnitude=0.01, duration=6))
 
 
 class TestInflationShock(unittest.TestCase):
@@ -465,14 +600,24 @@ class TestInflationShock(unittest.TestCase):
         self.assertEqual(shock.spike_magnitude, 2.5)
         self.assertEqual(shock.duration, 4)
         self.assertEqual(shock.start_period, 2)
+    
+    def test_shock_is_immutable_and_hashable(self):
+        """Test that shocks are frozen and usable as dictionary keys."""
+        shock = InflationShock(spike_magnitude=2.5, duration=4, start_period=2)
+        
+        with self.assertRaises(FrozenInstanceError):
+            shock.spike_magnitude = 0.0
+        self.assertEqual(hash(shock), hash(InflationShock(spike_magnitude=2.5, duration=4, start_period=2)))
+        self.assertNotEqual(shock, InflationShock(spike_magnitude=2.5, duration=4))
 
 
 class TestBankPanicModel(unittest.TestCase):
     """Test cases for the Bank Panic Model."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.model = BankPanicModel({})
+    @classmethod
+    def setUpClass(cls):
+        """Set up the model shared by the tests below; none of them modify it."""
+        cls.model = BankPanicModel({})
     
     def test_model_initialization(self):
         """Test model initialization with default parameters."""
@@ -587,9 +732,10 @@ class TestBankPanicShock(unittest.TestCase):
 class TestMilitarySpendingShockModel(unittest.TestCase):
     """Test cases for the Military Spending Shock Model."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.model = MilitarySpendingShockModel({})
+    @classmethod
+    def setUpClass(cls):
+        """Set up the model shared by the tests below; none of them modify it."""
+        cls.model = MilitarySpendingShockModel({})
     
     def test_model_initialization(self):
         """Test model initialization with default parameters."""
@@ -718,9 +864,10 @@ class TestMilitarySpendingShock(unittest.TestCase):
 class TestGlobalConflictModel(unittest.TestCase):
     """Test cases for the Global Conflict Model."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.model = GlobalConflictModel({})
+    @classmethod
+    def setUpClass(cls):
+        """Set up the model shared by the tests below; none of them modify it."""
+        cls.model = GlobalConflictModel({})
     
     def test_model_initialization(self):
         """Test model initialization with default parameters."""
@@ -884,10 +1031,11 @@ class TestGlobalConflictShock(unittest.TestCase):
 class TestIntegration(unittest.TestCase):
     """Integration tests for the complete simulation flow."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.engine = SimulationEngine()
-        self.interest_rate_scenario = {
+    @classmethod
+    def setUpClass(cls):
+        """Set up the engine and scenarios shared by the read-only tests below."""
+        cls.engine = SimulationEngine()
+        cls.interest_rate_scenario = {
             'model': 'interest_rate',
             'parameters': {
                 'periods': 10,
@@ -901,7 +1049,7 @@ class TestIntegration(unittest.TestCase):
                 }
             }
         }
-        self.inflation_shock_scenario = {
+        cls.inflation_shock_scenario = {
             'model': 'inflation_shock',
             'parameters': {
                 'periods': 8,
@@ -915,7 +1063,7 @@ class TestIntegration(unittest.TestCase):
                 }
             }
         }
-        self.bank_panic_scenario = {
+        cls.bank_panic_scenario = {
             'model': 'bank_panic',
             'parameters': {
                 'periods': 15,
@@ -929,7 +1077,7 @@ class TestIntegration(unittest.TestCase):
                 }
             }
         }
-        self.military_spending_scenario = {
+        cls.military_spending_scenario = {
             'model': 'military_spending_shock',
             'parameters': {
                 'periods': 12,
@@ -944,7 +1092,7 @@ class TestIntegration(unittest.TestCase):
                 }
             }
         }
-        self.global_conflict_scenario = {
+        cls.global_conflict_scenario = {
             'model': 'global_conflict',
             'parameters': {
                 'periods': 10,
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the export helpers in utils.formatters
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+import numpy as np
+from datetime import datetime
+from unittest.mock import patch
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils import formatters
+from utils.formatters import create_csv_export, export_results_json
+
+
+@unittest.skipIf(formatters.orjson is None, "orjson is not installed")
+class TestExportResultsJson(unittest.TestCase):
+    """Test that the orjson and stdlib exports write the same document."""
+    
+    def setUp(self):
+        """Create a scratch directory for the exported files."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+    
+    def _export(self, results, name, pretty):
+        """Export results and return the file contents."""
+        filename = os.path.join(self.tmpdir.name, name)
+        export_results_json(results, filename, pretty=pretty)
+        with open(filename) as f:
+            return f.read()
+    
+    def test_orjson_matches_stdlib(self):
+        """Test that both encoders produce equal JSON for awkward values."""
+        cases = {
+            'datetime_and_numpy': {
+                'created': datetime(2024, 1, 2, 3, 4, 5),
+                'series': np.array([1.0, 2.5, 4.0]),
+                'count': np.int64(3),
+                'mean': np.float64(2.5),
+                'periods': [0, 1, 2],
+                'summary': {'label': 'base', 'missing': None, 1: True},
+            },
+            'nan': {'gdp': [1.0, float('nan')], 'series': np.array([np.nan, 1.0])},
+            'infinity': {'summary': {'peak': float('inf'), 'trough': np.float64('-inf')}},
+            'wide_integer': {'total': 2 ** 70, 'periods': [0, 1]},
+        }
+        for name, results in cases.items():
+            for pretty in (True, False):
+                with self.subTest(case=name, pretty=pretty):
+                    fast = self._export(results, 'fast.json', pretty)
+                    with patch.object(formatters, 'orjson', None):
+                        stdlib = self._export(results, 'stdlib.json', pretty)
+                    
+                    # Re-encode so NaN compares equal and whitespace is ignored
+                    self.assertEqual(json.dumps(json.loads(fast), sort_keys=True),
+                                     json.dumps(json.loads(stdlib), sort_keys=True))
+
+
+class TestCreateCsvExport(unittest.TestCase):
+    """Test cases for create_csv_export."""
+    
+    def setUp(self):
+        """Create a scratch file name for the export."""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.filename = os.path.join(tmpdir.name, 'export.csv')
+    
+    def test_rows(self):
+        """Test that short series are padded and None is written as an empty cell."""
+        create_csv_export({
+            'periods': [0, 1, 2],
+            'gdp': np.array([1.5, 2.0, 2.5]),
+            'rate': [0.1, None],
+        }, self.filename)
+        
+        with open(self.filename) as f:
+            self.assertEqual(f.read(), "period,gdp,rate\n0,1.5,0.1\n1,2.0,\n2,2.5,\n")
+    
+    def test_rejects_non_sequence_values(self):
+        """Test that a summary dict or scalar is not written as a column."""
+        for value in ({'peak': 1.0}, 'label', 3.0):
+            with self.subTest(value=value):
+                with self.assertRaises(TypeError):
+                    create_csv_export({'periods': [0, 1], 'summary': value}, self.filename)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the numerical helpers in utils.math_utils
+"""
+
+import math
+import os
+import sys
+import unittest
+import numpy as np
+from unittest.mock import patch
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils import math_utils
+from utils.math_utils import (
+    calculate_statistics, moving_average, OnlineMovingAverage, persistence_powers,
+    _STATS_CACHE_MAX_BYTES
+)
+from utils._window_ops import PARALLEL_TILES, rolling_mean, rolling_mean_parallel
+
+
+class TestCalculateStatistics(unittest.TestCase):
+    """Test cases for calculate_statistics."""
+    
+    def test_nan_makes_every_statistic_nan(self):
+        """Test that a NaN anywhere in the series propagates to all statistics."""
+        stats = calculate_statistics([1.0, float('nan'), 3.0])
+        
+        self.assertEqual(stats['count'], 3)
+        for key, value in stats.items():
+            if key != 'count':
+                self.assertTrue(math.isnan(value), key)
+    
+    def test_repeated_calls_return_independent_results(self):
+        """Test that memoized statistics come back as fresh, equal dicts."""
+        data = [3.0, 1.0, 4.0, 1.0, 5.0]
+        first = calculate_statistics(data)
+        first['mean'] = -1.0
+        first['extra'] = True
+        
+        second = calculate_statistics(data)
+        third = calculate_statistics(data)
+        self.assertEqual(second, third)
+        self.assertIsNot(second, third)
+        self.assertEqual(second['mean'], 2.8)
+        self.assertNotIn('extra', second)
+    
+    def test_large_series_bypass_the_cache(self):
+        """Test that series above _STATS_CACHE_MAX_BYTES are reduced without memoizing."""
+        data = np.arange(_STATS_CACHE_MAX_BYTES // 8 + 1, dtype=np.float64)
+        with patch.object(math_utils, '_cached_statistics') as cached:
+            stats = calculate_statistics(data)
+        
+        cached.assert_not_called()
+        self.assertEqual(stats['count'], data.size)
+        self.assertEqual(stats['max'], data[-1])
+        self.assertAlmostEqual(stats['mean'], data.mean())
+        self.assertAlmostEqual(stats['std'], data.std())
+    
+    def test_multidimensional_input_is_flattened(self):
+        """Test that 2-D input gives the statistics of its flattened values, cached or not."""
+        rows = _STATS_CACHE_MAX_BYTES // 8 // 4 + 1
+        for data in (np.arange(12.0).reshape(3, 4), np.arange(rows * 4.0).reshape(rows, 4)):
+            with self.subTest(shape=data.shape):
+                stats = calculate_statistics(data)
+                flat = data.ravel()
+                
+                self.assertEqual(stats['count'], flat.size)
+                self.assertEqual(stats['min'], flat.min())
+                self.assertEqual(stats['max'], flat.max())
+                self.assertAlmostEqual(stats['mean'], flat.mean())
+                self.assertAlmostEqual(stats['median'], np.median(flat))
+                self.assertAlmostEqual(stats['q25'], np.percentile(flat, 25))
+
+
+class TestOnlineMovingAverage(unittest.TestCase):
+    """Test cases for the streaming OnlineMovingAverage."""
+    
+    def test_updates_match_moving_average(self):
+        """Test that feeding values one at a time reproduces moving_average."""
+        data = np.random.default_rng(0).normal(100.0, 5.0, size=200)
+        for window in (1, 2, 7, 50, 200):
+            with self.subTest(window=window):
+                online = OnlineMovingAverage(window)
+                streamed = [online.update(value) for value in data]
+                np.testing.assert_allclose(streamed, moving_average(data, window), rtol=1e-12)
+    
+    def test_non_positive_window_raises(self):
+        """Test that a window of zero or less is rejected."""
+        for window in (0, -3):
+            with self.subTest(window=window):
+                with self.assertRaises(ValueError):
+                    OnlineMovingAverage(window)
+
+
+class TestPersistencePowers(unittest.TestCase):
+    """Test cases for the cached persistence power table."""
+    
+    def test_powers_are_shared_and_read_only(self):
+        """Test that the table holds persistence ** k and cannot be modified in place."""
+        powers = persistence_powers(0.8, 6)
+        
+        np.testing.assert_allclose(powers, [0.8 ** k for k in range(6)], rtol=1e-15)
+        self.assertIs(persistence_powers(0.8, 6), powers)
+        with self.assertRaises(ValueError):
+            powers[0] = 2.0
+
+
+class TestRollingMeanKernels(unittest.TestCase):
+    """Test cases for the tiled rolling_mean_parallel kernel."""
+    
+    def test_parallel_matches_serial(self):
+        """Test tile boundaries on lengths that do not divide into PARALLEL_TILES."""
+        rng = np.random.default_rng(1)
+        for n in (PARALLEL_TILES - 1, PARALLEL_TILES * 3 + 5, 1001):
+            tile_size = -(-n // PARALLEL_TILES)
+            for window in (1, 3, tile_size + 1, 3 * tile_size + 2, n):
+                with self.subTest(n=n, window=window):
+                    data = rng.normal(100.0, 5.0, size=n)
+                    serial = np.empty(n)
+                    parallel = np.empty(n)
+                    rolling_mean(data, window, serial)
+                    rolling_mean_parallel(data, window, parallel)
+                    
+                    np.testing.assert_allclose(parallel, serial, rtol=1e-12)
+                    np.testing.assert_allclose(parallel, moving_average(data, window), rtol=1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
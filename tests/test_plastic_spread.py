@@ -173,6 +173,15 @@ def test_intervention_effectiveness():
         'combined': combined
     }
 
+def test_production_reduction_without_binding_cap():
+    """Test that a cap that never applies reports exactly no production reduction."""
+    # The default cap year lies beyond a 10-year run
+    model = PlasticSpreadSimulationModel({'periods': 10})
+    
+    production_cap = model._run_single_scenario('production_cap')
+    
+    assert production_cap['summary']['cumulative_production_reduction_percent'] == 0.0
+
 def main():
     """Run all tests."""
     print("🧪 Running Plastic Spread Simulation Model Tests\n")